@@ -7,13 +7,21 @@ Requires Python 3.6+
 For Python 3.6, install: pip install dataclasses
 """
 
+import heapq
 import random
 import json
-from typing import Dict, List, Optional, Tuple
+from bisect import bisect_right
+from collections import deque
+from itertools import accumulate
+from typing import Collection, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
 
+# Weekly fraction of an annual rate (multiply instead of dividing by 52 every tick)
+_INV_52 = 1.0 / 52.0
+
+
 class NewsSentiment(Enum):
     """Sentiment types for news"""
     POSITIVE = "positive"
@@ -40,9 +48,13 @@ class SuccessSeverity(Enum):
     HIGH = "high"      # Major breakthroughs, +12% to +20% impact
 
 
-@dataclass
+@dataclass(eq=False)
 class CompanyEvent:
-    """Represents an internal company event that may generate news"""
+    """Represents an internal company event that may generate news
+
+    eq=False: events are compared by identity, so list.remove() doesn't
+    compare every field of every pending event.
+    """
     event_type: EventType
     severity: float  # 0.0 to 1.0, affects impact magnitude
     description: str  # Internal description
@@ -78,7 +90,7 @@ class CompanyEvent:
         )
 
 
-@dataclass
+@dataclass(eq=False)
 class NewsReport:
     """Represents news from three reputable sources
 
@@ -121,7 +133,7 @@ class NewsReport:
             )
 
 
-@dataclass
+@dataclass(eq=False)
 class PendingNewsImpact:
     """Tracks a news story that will affect stock price in the future
 
@@ -168,6 +180,14 @@ class PendingNewsImpact:
 
 
 
+def _split_templates(templates_by_industry: Dict[str, List[str]]) -> Dict[str, List[Tuple[str, str]]]:
+    """Split each "{company}" template into a (prefix, suffix) pair"""
+    return {
+        industry: [tuple(template.split("{company}", 1)) for template in templates]
+        for industry, templates in templates_by_industry.items()
+    }
+
+
 class BreakingNewsSystem:
     """Generates breaking news based on internal company events with sector-specific content"""
 
@@ -1156,8 +1176,30 @@ class BreakingNewsSystem:
         ],
     }
 
-
-
+    # Templates pre-split around "{company}" into (prefix, suffix) so filling in a
+    # company name is plain concatenation instead of re-parsing with str.format
+    LOW_SEVERITY_SCANDAL_PARTS = _split_templates(LOW_SEVERITY_SCANDAL_TEMPLATES)
+    MEDIUM_SEVERITY_SCANDAL_PARTS = _split_templates(MEDIUM_SEVERITY_SCANDAL_TEMPLATES)
+    HIGH_SEVERITY_SCANDAL_PARTS = _split_templates(HIGH_SEVERITY_SCANDAL_TEMPLATES)
+    LOW_SEVERITY_SUCCESS_PARTS = _split_templates(LOW_SEVERITY_SUCCESS_TEMPLATES)
+    MEDIUM_SEVERITY_SUCCESS_PARTS = _split_templates(MEDIUM_SEVERITY_SUCCESS_TEMPLATES)
+    HIGH_SEVERITY_SUCCESS_PARTS = _split_templates(HIGH_SEVERITY_SUCCESS_TEMPLATES)
+
+    # Same tables indexed by severity tier (0 = LOW, 1 = MEDIUM, 2 = HIGH)
+    SCANDAL_PARTS_BY_TIER = (LOW_SEVERITY_SCANDAL_PARTS, MEDIUM_SEVERITY_SCANDAL_PARTS, HIGH_SEVERITY_SCANDAL_PARTS)
+    SUCCESS_PARTS_BY_TIER = (LOW_SEVERITY_SUCCESS_PARTS, MEDIUM_SEVERITY_SUCCESS_PARTS, HIGH_SEVERITY_SUCCESS_PARTS)
+
+    # Confidence prefix for accurate reports of confirmed events (LOW is the fallback)
+    SCANDAL_CONFIDENCE_PREFIXES = {
+        ScandalSeverity.HIGH: "BREAKING: ",  # High confidence for severe scandals
+        ScandalSeverity.MEDIUM: "CONFIRMED: ",  # Moderate confidence
+        ScandalSeverity.LOW: "Alleged: ",  # Lower confidence for minor issues
+    }
+    SUCCESS_CONFIDENCE_PREFIXES = {
+        SuccessSeverity.HIGH: "BREAKING: ",  # High confidence for major breakthroughs
+        SuccessSeverity.MEDIUM: "CONFIRMED: ",  # Moderate confidence
+        SuccessSeverity.LOW: "Reports indicate: ",  # Lower confidence for minor wins
+    }
 
     def __init__(self):
         self.pending_impacts: List[PendingNewsImpact] = []
@@ -1188,6 +1230,14 @@ class BreakingNewsSystem:
         news_system.news_history = [tuple(item) for item in data.get('news_history', [])]
         return news_system
 
+    @staticmethod
+    def _misreport_templates(parts_by_tier: Tuple[Dict[str, List[Tuple[str, str]]], ...], industry: str) -> List[Tuple[str, str]]:
+        """Templates for a wrong or fake report at a random severity (50% LOW, 30% MEDIUM, 20% HIGH)"""
+        severity_rand = random.random()
+        tier = 0 if severity_rand < 0.5 else 1 if severity_rand < 0.8 else 2
+        parts = parts_by_tier[tier]
+        return parts.get(industry) or parts["Technology"]
+
     def _generate_company_event(self, company: 'Company', week_number: int) -> Optional[CompanyEvent]:
         """Generate internal company event based on company fundamentals"""
         # Base probability: 25% chance of event each week
@@ -1239,20 +1289,21 @@ class BreakingNewsSystem:
         # Select appropriate template based on industry and event type
         if event_type == EventType.SCANDAL:
             if scandal_severity == ScandalSeverity.LOW:
-                templates = self.LOW_SEVERITY_SCANDAL_TEMPLATES.get(company.industry, self.LOW_SEVERITY_SCANDAL_TEMPLATES["Technology"])
+                templates = self.LOW_SEVERITY_SCANDAL_PARTS.get(company.industry, self.LOW_SEVERITY_SCANDAL_PARTS["Technology"])
             elif scandal_severity == ScandalSeverity.MEDIUM:
-                templates = self.MEDIUM_SEVERITY_SCANDAL_TEMPLATES.get(company.industry, self.MEDIUM_SEVERITY_SCANDAL_TEMPLATES["Technology"])
+                templates = self.MEDIUM_SEVERITY_SCANDAL_PARTS.get(company.industry, self.MEDIUM_SEVERITY_SCANDAL_PARTS["Technology"])
             else:  # HIGH
-                templates = self.HIGH_SEVERITY_SCANDAL_TEMPLATES.get(company.industry, self.HIGH_SEVERITY_SCANDAL_TEMPLATES["Technology"])
+                templates = self.HIGH_SEVERITY_SCANDAL_PARTS.get(company.industry, self.HIGH_SEVERITY_SCANDAL_PARTS["Technology"])
         else:  # SUCCESS
             if success_severity == SuccessSeverity.LOW:
-                templates = self.LOW_SEVERITY_SUCCESS_TEMPLATES.get(company.industry, self.LOW_SEVERITY_SUCCESS_TEMPLATES["Technology"])
+                templates = self.LOW_SEVERITY_SUCCESS_PARTS.get(company.industry, self.LOW_SEVERITY_SUCCESS_PARTS["Technology"])
             elif success_severity == SuccessSeverity.MEDIUM:
-                templates = self.MEDIUM_SEVERITY_SUCCESS_TEMPLATES.get(company.industry, self.MEDIUM_SEVERITY_SUCCESS_TEMPLATES["Technology"])
+                templates = self.MEDIUM_SEVERITY_SUCCESS_PARTS.get(company.industry, self.MEDIUM_SEVERITY_SUCCESS_PARTS["Technology"])
             else:  # HIGH
-                templates = self.HIGH_SEVERITY_SUCCESS_TEMPLATES.get(company.industry, self.HIGH_SEVERITY_SUCCESS_TEMPLATES["Technology"])
+                templates = self.HIGH_SEVERITY_SUCCESS_PARTS.get(company.industry, self.HIGH_SEVERITY_SUCCESS_PARTS["Technology"])
 
-        description = random.choice(templates).format(company=company.name)
+        prefix, suffix = random.choice(templates)
+        description = prefix + company.name + suffix
 
         return CompanyEvent(
             event_type=event_type,
@@ -1292,6 +1343,8 @@ class BreakingNewsSystem:
 
         # All events available for reporting (pending and ready)
         all_events = pending_events + ready_events
+        # Candidates for fake news, built once for all three outlets
+        company_names = list(companies)
 
         # Helper function to generate a report for an outlet
         def generate_outlet_report(outlet_name: str) -> str:
@@ -1317,20 +1370,10 @@ class BreakingNewsSystem:
                             prefix = "RUMOR: "
                         elif event.event_type == EventType.SCANDAL:
                             # Confirmed scandal - add confidence based on severity
-                            if event.scandal_severity == ScandalSeverity.HIGH:
-                                prefix = "BREAKING: "  # High confidence for severe scandals
-                            elif event.scandal_severity == ScandalSeverity.MEDIUM:
-                                prefix = "CONFIRMED: "  # Moderate confidence
-                            else:  # LOW
-                                prefix = "Alleged: "  # Lower confidence for minor issues
+                            prefix = self.SCANDAL_CONFIDENCE_PREFIXES.get(event.scandal_severity, "Alleged: ")
                         else:  # SUCCESS
                             # Confirmed success - add confidence based on severity
-                            if event.success_severity == SuccessSeverity.HIGH:
-                                prefix = "BREAKING: "  # High confidence for major breakthroughs
-                            elif event.success_severity == SuccessSeverity.MEDIUM:
-                                prefix = "CONFIRMED: "  # Moderate confidence
-                            else:  # LOW
-                                prefix = "Reports indicate: "  # Lower confidence for minor wins
+                            prefix = self.SUCCESS_CONFIDENCE_PREFIXES.get(event.success_severity, "Reports indicate: ")
                         items.append(f"• {prefix}{event.description}")
                     else:
                         # Report the opposite or completely wrong
@@ -1348,50 +1391,28 @@ class BreakingNewsSystem:
 
                         if event.event_type == EventType.SUCCESS:
                             # Wrong: report as negative (pick random severity)
-                            severity_rand = random.random()
-                            if severity_rand < 0.5:
-                                templates = self.LOW_SEVERITY_SCANDAL_TEMPLATES.get(event.industry, self.LOW_SEVERITY_SCANDAL_TEMPLATES["Technology"])
-                            elif severity_rand < 0.8:
-                                templates = self.MEDIUM_SEVERITY_SCANDAL_TEMPLATES.get(event.industry, self.MEDIUM_SEVERITY_SCANDAL_TEMPLATES["Technology"])
-                            else:
-                                templates = self.HIGH_SEVERITY_SCANDAL_TEMPLATES.get(event.industry, self.HIGH_SEVERITY_SCANDAL_TEMPLATES["Technology"])
+                            templates = self._misreport_templates(self.SCANDAL_PARTS_BY_TIER, event.industry)
                         else:  # SCANDAL
                             # Wrong: report as positive (pick random severity)
-                            severity_rand = random.random()
-                            if severity_rand < 0.5:
-                                templates = self.LOW_SEVERITY_SUCCESS_TEMPLATES.get(event.industry, self.LOW_SEVERITY_SUCCESS_TEMPLATES["Technology"])
-                            elif severity_rand < 0.8:
-                                templates = self.MEDIUM_SEVERITY_SUCCESS_TEMPLATES.get(event.industry, self.MEDIUM_SEVERITY_SUCCESS_TEMPLATES["Technology"])
-                            else:
-                                templates = self.HIGH_SEVERITY_SUCCESS_TEMPLATES.get(event.industry, self.HIGH_SEVERITY_SUCCESS_TEMPLATES["Technology"])
-                        wrong_text = random.choice(templates).format(company=company_name)
+                            templates = self._misreport_templates(self.SUCCESS_PARTS_BY_TIER, event.industry)
+                        wrong_prefix, wrong_suffix = random.choice(templates)
+                        wrong_text = wrong_prefix + company_name + wrong_suffix
                         items.append(f"• {prefix}{wrong_text}")
                 else:
                     # Generate completely fake news
-                    company_name = random.choice(list(companies.keys()))
+                    company_name = random.choice(company_names)
                     company = companies[company_name]
 
                     # 50/50 positive or negative fake news
                     if random.random() < 0.5:
                         # Pick random severity for fake success news
-                        severity_rand = random.random()
-                        if severity_rand < 0.5:
-                            templates = self.LOW_SEVERITY_SUCCESS_TEMPLATES.get(company.industry, self.LOW_SEVERITY_SUCCESS_TEMPLATES["Technology"])
-                        elif severity_rand < 0.8:
-                            templates = self.MEDIUM_SEVERITY_SUCCESS_TEMPLATES.get(company.industry, self.MEDIUM_SEVERITY_SUCCESS_TEMPLATES["Technology"])
-                        else:
-                            templates = self.HIGH_SEVERITY_SUCCESS_TEMPLATES.get(company.industry, self.HIGH_SEVERITY_SUCCESS_TEMPLATES["Technology"])
+                        templates = self._misreport_templates(self.SUCCESS_PARTS_BY_TIER, company.industry)
                     else:
                         # Pick random severity for fake scandal
-                        severity_rand = random.random()
-                        if severity_rand < 0.5:
-                            templates = self.LOW_SEVERITY_SCANDAL_TEMPLATES.get(company.industry, self.LOW_SEVERITY_SCANDAL_TEMPLATES["Technology"])
-                        elif severity_rand < 0.8:
-                            templates = self.MEDIUM_SEVERITY_SCANDAL_TEMPLATES.get(company.industry, self.MEDIUM_SEVERITY_SCANDAL_TEMPLATES["Technology"])
-                        else:
-                            templates = self.HIGH_SEVERITY_SCANDAL_TEMPLATES.get(company.industry, self.HIGH_SEVERITY_SCANDAL_TEMPLATES["Technology"])
+                        templates = self._misreport_templates(self.SCANDAL_PARTS_BY_TIER, company.industry)
 
-                    fake_text = random.choice(templates).format(company=company_name)
+                    fake_prefix, fake_suffix = random.choice(templates)
+                    fake_text = fake_prefix + company_name + fake_suffix
                     # Fake news is always marked as rumor since it's unconfirmed
                     items.append(f"• RUMOR: {fake_text}")
 
@@ -1422,12 +1443,11 @@ class BreakingNewsSystem:
 
         # Step 1: Generate new internal events for all companies
         for company_name, company in companies.items():
-            if company_name not in self.company_events:
-                self.company_events[company_name] = []
+            events = self.company_events.setdefault(company_name, [])
 
             event = self._generate_company_event(company, week_number)
             if event:
-                self.company_events[company_name].append(event)
+                events.append(event)
 
         # Step 2: Calculate market impacts based on events becoming public
         # This is independent of what outlets report
@@ -1555,8 +1575,10 @@ class BreakingNewsSystem:
                 # Just display the message without modifying price
                 if not use_precompiled_prices:
                     # Apply the impact (only when NOT using precompiled prices)
-                    company.price *= (1 + impact_pct / 100)
-                    company.price = max(0.01, company.price)
+                    price = company.price * (1 + impact_pct / 100)
+                    if price < 0.01:
+                        price = 0.01  # Prevent negative prices
+                    company.price = price
 
                 # Show the appropriate message based on the impact amount
                 display_magnitude = abs(impact_pct)
@@ -1621,9 +1643,11 @@ class Company:
         # EPS changes slowly (company fundamentals grow ~5-8% annually on average)
         # That's about 0.1-0.15% per week
         annual_growth = random.uniform(-0.08, 0.12)  # -8% to +12% annual
-        weekly_change = annual_growth / 52.0
-        self.earnings_per_share *= (1 + weekly_change)
-        self.earnings_per_share = max(0.001, self.earnings_per_share)  # Prevent negative earnings
+        weekly_change = annual_growth * _INV_52
+        eps = self.earnings_per_share * (1 + weekly_change)
+        if eps < 0.001:
+            eps = 0.001  # Prevent negative earnings
+        self.earnings_per_share = eps
 
     def get_pe_ratio(self) -> float:
         """Calculate current P/E ratio (Price to Earnings)"""
@@ -1644,17 +1668,18 @@ class Company:
 
         # Update fundamental price (random walk on fundamentals)
         # Fundamentals grow/shrink: 40-50% per year = ~0.75-0.95% per week
-        annual_fundamental_change = random.uniform(-0.40, 0.50)  # -40% to +50% annual
-        weekly_fundamental_change = annual_fundamental_change / 52.0
-        self.fundamental_price *= (1 + weekly_fundamental_change)
-        self.fundamental_price = max(0.01, self.fundamental_price)  # Prevent negative prices
+        # -40% to +50% annual, scaled to a weekly change
+        fundamental = self.fundamental_price * (1.0 + random.uniform(-0.40, 0.50) * _INV_52)
+        if fundamental < 0.01:
+            fundamental = 0.01  # Prevent negative prices
+        self.fundamental_price = fundamental
 
         # Mean reversion: pull actual price toward fundamental
         # 30% of the gap closes each week (liquidity refills, temporary impact fades)
-        price_gap = self.fundamental_price - self.price
-        mean_reversion = price_gap * 0.30
-        self.price += mean_reversion
-        self.price = max(0.01, self.price)  # Prevent negative prices
+        price = self.price + (fundamental - self.price) * 0.30
+        if price < 0.01:
+            price = 0.01  # Prevent negative prices
+        self.price = price
 
         self.price_history.append(self.price)
 
@@ -1672,6 +1697,22 @@ class Company:
         4. Notional dampener: trades under $1M get reduced slippage
         5. Volatility adjustment: calm stocks get cheaper execution
         """
+        slippage, _ = self._slippage_fraction(shares, slippage_multiplier)
+
+        # Slippage goes against the trader (increases buy price, decreases sell price)
+        if is_buy:
+            return 1 + slippage
+        else:
+            return 1 - slippage
+
+    def _slippage_fraction(self, shares: float, slippage_multiplier: float = 1.0) -> Tuple[float, float]:
+        """Slippage fraction for a trade, plus its elasticity d(ln slippage)/d(ln shares)
+
+        Slippage is a power law in trade size: sqrt from the ADV term (unless the
+        tiny-trade floor applies) times linear from the notional dampener (under $1M),
+        and flat once the 25% cap kicks in. The elasticity lets shares_for_amount()
+        take exact Newton steps.
+        """
         # Estimate average daily volume based on market cap and liquidity
         # (same as apply_market_impact for consistency)
         if self.liquidity == LiquidityLevel.HIGH:
@@ -1691,6 +1732,7 @@ class Company:
         # Prevents $20k-$50k trades from being disproportionately punished
         min_trade_pct = 0.00005  # 0.005% of ADV
         effective_trade_pct = max(trade_pct_of_daily_volume, min_trade_pct)
+        elasticity = 0.5 if trade_pct_of_daily_volume > min_trade_pct else 0.0
 
         # Slippage coefficient (slightly higher than market impact)
         # Market impact affects the market price, slippage is what you pay
@@ -1718,18 +1760,56 @@ class Company:
         # This makes early-game trading on low-liquidity stocks much less punishing
         notional_dampener = min(1.0, trade_value / 1_000_000)
         slippage *= notional_dampener
+        if trade_value < 1_000_000:
+            elasticity += 1.0
 
         # Apply slippage multiplier (e.g., for Mystical Lender penalty)
         slippage *= slippage_multiplier
 
         # Cap maximum slippage at 25% to prevent extreme cases (after multiplier)
-        slippage = min(slippage, 0.25 * slippage_multiplier)
+        if slippage > 0.25 * slippage_multiplier:
+            slippage = 0.25 * slippage_multiplier
+            elasticity = 0.0
 
-        # Slippage goes against the trader (increases buy price, decreases sell price)
-        if is_buy:
-            return 1 + slippage
-        else:
-            return 1 - slippage
+        return slippage, elasticity
+
+    def shares_for_amount(self, dollar_amount: float, is_buy: bool, slippage_multiplier: float = 1.0) -> Tuple[float, float]:
+        """Find how many shares trade for dollar_amount once slippage is included
+
+        Solves shares * price * slippage_factor == dollar_amount and returns
+        (shares, slippage_factor). The slipped trade value is monotonic in shares,
+        so Newton's method from the no-slippage estimate converges in a couple of
+        steps (instead of a fixed number of slippage re-evaluations).
+        """
+        sign = 1.0 if is_buy else -1.0
+        price = self.price
+        slippage_fraction = self._slippage_fraction  # Bound once for the Newton loop
+        shares = dollar_amount / price  # Initial estimate (no slippage)
+        for _ in range(8):
+            slippage, elasticity = slippage_fraction(shares, slippage_multiplier)
+            # value(shares) = shares * price * (1 +/- slippage); d(value)/d(shares) below
+            error = shares * price * (1.0 + sign * slippage) - dollar_amount
+            slope = price * (1.0 + sign * slippage * (1.0 + elasticity))
+            step = error / slope
+            shares -= step
+            if abs(step) <= shares * 1e-12:
+                break
+        slippage, _ = slippage_fraction(shares, slippage_multiplier)
+        return shares, 1.0 + sign * slippage
+
+    def execute_trade(self, shares: float, is_buy: bool, slippage_multiplier: float = 1.0, slippage_factor: Optional[float] = None) -> Tuple[float, float, float]:
+        """Fill a trade at the slipped price and move the market price
+
+        Pass slippage_factor if the caller already priced the trade (e.g. to check funds).
+        Returns (old_price, effective_price, new_price).
+        """
+        old_price = self.price
+        if slippage_factor is None:
+            slippage_factor = self.calculate_slippage(shares, is_buy, slippage_multiplier)
+        effective_price = old_price * slippage_factor
+        new_price = self.apply_market_impact(shares, is_buy)
+        self.price = new_price
+        return old_price, effective_price, new_price
 
     def apply_market_impact(self, shares: int, is_buy: bool) -> float:
         """Apply temporary market impact from a trade
@@ -1864,17 +1944,20 @@ class Company:
         return company
 
     def __str__(self):
-        # Format market cap in millions or billions
-        if self.market_cap >= 1_000_000_000:
-            market_cap_str = f"${self.market_cap / 1_000_000_000:.1f}B"
+        # Format market cap in millions or billions (pick the unit first so there is one format site)
+        market_cap = self.market_cap
+        if market_cap >= 1_000_000_000:
+            cap, cap_unit = market_cap / 1_000_000_000, "B"
         else:
-            market_cap_str = f"${self.market_cap / 1_000_000:.1f}M"
-        return f"{self.name} ({self.industry}) - ${self.price:.2f} {self.get_liquidity_indicator()} [Cap: {market_cap_str}]"
+            cap, cap_unit = market_cap / 1_000_000, "M"
+        return f"{self.name} ({self.industry}) - ${self.price:.2f} {self.get_liquidity_indicator()} [Cap: ${cap:.1f}{cap_unit}]"
 
 
 class Treasury:
     """Represents treasury bonds"""
 
+    __slots__ = ('name', 'interest_rate', 'price')
+
     def __init__(self):
         self.name = "US Treasury Bonds"
         self.interest_rate = 3.5  # 3.5% annual return
@@ -1902,6 +1985,8 @@ class Treasury:
 class QuantumSingularity:
     """Represents Quantum Singularity - a permanent investment with passive income"""
 
+    __slots__ = ('name', 'monthly_return_rate', 'price', 'description')
+
     def __init__(self):
         self.name = "Quantum Singularity"
         self.monthly_return_rate = 2.0  # 2% monthly return
@@ -1935,10 +2020,12 @@ class QuantumSingularity:
 class ElfQueenWater:
     """Represents Elf Queen's 'Water' - a coveted meme commodity"""
 
+    __slots__ = ('name', 'price', 'price_history', 'weeks_since_change', 'description')
+
     def __init__(self):
         self.name = "Elf Queen's \"Water\""
         self.price = 4000.0  # $4000 per vial
-        self.price_history: List[float] = []
+        self.price_history: deque = deque(maxlen=52)  # Keep 52 weeks of history (oldest drops off)
         self.weeks_since_change = 0  # Track weeks since last price change
         self.description = "Coveted by some... men. If you know, you know."
 
@@ -1955,14 +2042,12 @@ class ElfQueenWater:
             self.weeks_since_change = 0  # Reset counter
 
         self.price_history.append(self.price)
-        if len(self.price_history) > 52:  # Keep 52 weeks of history
-            self.price_history.pop(0)
 
     def to_dict(self) -> dict:
         """Serialize to dictionary"""
         return {
             'price': self.price,
-            'price_history': self.price_history,
+            'price_history': list(self.price_history),
             'weeks_since_change': self.weeks_since_change
         }
 
@@ -1971,7 +2056,7 @@ class ElfQueenWater:
         """Deserialize from dictionary"""
         eqw = ElfQueenWater()
         eqw.price = data['price']
-        eqw.price_history = data.get('price_history', [])
+        eqw.price_history = deque(data.get('price_history', []), maxlen=52)
         eqw.weeks_since_change = data.get('weeks_since_change', 0)
         return eqw
 
@@ -1983,13 +2068,19 @@ class ElfQueenWater:
 class VoidStocks:
     """Represents Void Stocks - 50% chance to copy random stock, 50% chance to enter void state ($0)"""
 
+    __slots__ = ('name', 'price', 'companies', 'weeks_elapsed', 'current_company_name',
+                 'company_names', '_company_list', 'description', 'is_void_week')
+
+    _VOID = "VOID"  # Shown instead of a company name while in void state
+
     def __init__(self, companies: Dict[str, 'Company']):
         self.name = "Void Stocks"
         self.price = 0.0  # Start at $0
         self.companies = companies
         self.weeks_elapsed = 0  # Track weeks
-        self.current_company_index = 0  # Which company we're copying
-        self.company_names = []  # Will be populated when we have companies
+        self.current_company_name = ""  # Which company we're copying
+        self.company_names = sorted(companies.keys())  # Fixed for the whole game (see refresh_company_names)
+        self._company_list = [companies[name] for name in self.company_names]  # Company objects, in company_names order
         self.description = "Extremely risky stocks - 50% chance to copy a random company, 50% chance to become worthless"
         self.is_void_week = True  # Start in void state
 
@@ -1997,20 +2088,19 @@ class VoidStocks:
         """Update price - 50/50 chance to copy a random company or enter void state"""
         self.weeks_elapsed += 1
 
-        # Update company names list if needed
-        if not self.company_names and self.companies:
-            self.company_names = sorted(list(self.companies.keys()))
-
         # 50/50 chance each week
-        if random.random() < 0.5:
+        roll = random.random()
+        if roll < 0.5:
             # Lucky: Copy a random company's stock
             self.is_void_week = False
-            if self.company_names:
+            company_list = self._company_list
+            if company_list:
                 # Pick a random company instead of cycling through them
-                company_name = random.choice(self.company_names)
-                self.price = self.companies[company_name].price
+                # roll is uniform on [0, 0.5), so roll * 2 indexes the list without a second draw
+                company = company_list[int(roll * 2.0 * len(company_list))]
+                self.price = company.price
                 # Store which company we copied for display purposes
-                self.current_company_index = self.company_names.index(company_name)
+                self.current_company_name = company.name
             else:
                 self.price = 0.0  # No companies available
         else:
@@ -2018,20 +2108,23 @@ class VoidStocks:
             self.is_void_week = True
             self.price = 0.0
 
+    def refresh_company_names(self):
+        """Re-read the company list (call after adding companies to the shared dict)"""
+        self.company_names = sorted(self.companies.keys())
+        self._company_list = [self.companies[name] for name in self.company_names]
+
     def get_current_company_name(self) -> str:
         """Get the name of the company currently being copied (if any)"""
-        if self.is_void_week or not self.company_names:
-            return "VOID"
-        # Get the company at the current index (randomly selected)
-        idx = self.current_company_index % len(self.company_names)
-        return self.company_names[idx]
+        if self.is_void_week:
+            return self._VOID
+        return self.current_company_name or self._VOID
 
     def to_dict(self) -> dict:
         """Serialize to dictionary"""
         return {
             'price': self.price,
             'weeks_elapsed': self.weeks_elapsed,
-            'current_company_index': self.current_company_index,
+            'current_company_name': self.current_company_name,
             'company_names': self.company_names,
             'is_void_week': self.is_void_week
         }
@@ -2042,8 +2135,17 @@ class VoidStocks:
         vs = VoidStocks(companies)
         vs.price = data['price']
         vs.weeks_elapsed = data.get('weeks_elapsed', 0)
-        vs.current_company_index = data.get('current_company_index', 0)
-        vs.company_names = data.get('company_names', [])
+        # Skip saved names whose company no longer exists, keeping both lists in step
+        saved_names = [name for name in data.get('company_names') or [] if name in companies]
+        if saved_names:  # Old saves may have an empty list
+            vs.company_names = saved_names
+            vs._company_list = [companies[name] for name in saved_names]
+        if 'current_company_name' in data:
+            vs.current_company_name = data['current_company_name']
+        elif vs.company_names:
+            # Old saves stored an index into company_names
+            idx = data.get('current_company_index', 0) % len(vs.company_names)
+            vs.current_company_name = vs.company_names[idx]
         vs.is_void_week = data.get('is_void_week', True)
         return vs
 
@@ -2051,13 +2153,16 @@ class VoidStocks:
         if self.is_void_week:
             return f"{self.name} - ${self.price:.2f}/share [VOID STATE]"
         else:
-            company = self.get_current_company_name()
+            # Not void, so skip get_current_company_name()'s void check
+            company = self.current_company_name or self._VOID
             return f"{self.name} - ${self.price:.2f}/share [Copying: {company}]"
 
 
 class VoidCatalyst:
     """Represents Void Catalyst - unique asset that auto-sells after 4 weeks"""
 
+    __slots__ = ('name', 'price', 'is_owned', 'owner_name', 'weeks_owned', 'players_owned_this_cycle', 'description')
+
     def __init__(self):
         self.name = "Void Catalyst"
         self.price = 100000.0  # $100k starting price
@@ -2069,36 +2174,37 @@ class VoidCatalyst:
 
     def update_price(self, player_name: str = None):
         """Update price - always goes up. Auto-sell after 4 weeks if owned."""
-        # Price always increases by 5-10%
-        increase_percent = random.uniform(5.0, 10.0)
-        self.price *= (1 + increase_percent / 100)
+        # Price always increases by 5-10% (drawn directly as a fraction)
+        self.price *= 1.0 + random.uniform(0.05, 0.10)
 
         # Track ownership time
         if self.is_owned:
             self.weeks_owned += 1
 
-    def can_player_buy(self, player_name: str, all_human_players: List[str]) -> Tuple[bool, str]:
+    def can_player_buy(self, player_name: str, all_human_players: Collection[str]) -> Tuple[bool, str]:
         """Check if a player is allowed to buy the Void Catalyst"""
         # If already owned by someone, can't buy
         if self.is_owned:
             return False, f"Void Catalyst is already owned by {self.owner_name}!"
 
         # If this player already owned it this cycle, can't buy again until cycle resets
-        if player_name in self.players_owned_this_cycle:
+        owned = self.players_owned_this_cycle
+        if player_name in owned:
             # Check if we should reset the cycle (all players have owned it)
-            if len(self.players_owned_this_cycle) >= len(all_human_players):
+            if len(owned) >= len(all_human_players):
                 # Cycle complete, reset for next time
-                self.players_owned_this_cycle.clear()
+                owned.clear()
                 # But still block THIS purchase - player must wait for next opportunity
                 return False, "You already used your turn this cycle. Availability has been reset - try again!"
             else:
                 # Still waiting for other players
-                remaining_players = set(all_human_players) - self.players_owned_this_cycle
+                # frozenset() of the game's cached frozenset is the same object, not a copy
+                remaining_players = frozenset(all_human_players) - owned
                 return False, f"You already owned the Void Catalyst this cycle. Waiting for: {', '.join(sorted(remaining_players))}"
 
         return True, "OK"
 
-    def buy(self, player_name: str, all_human_players: List[str]) -> Tuple[bool, str]:
+    def buy(self, player_name: str, all_human_players: Collection[str]) -> Tuple[bool, str]:
         """Attempt to buy the Void Catalyst"""
         # Check if player can buy
         can_buy, reason = self.can_player_buy(player_name, all_human_players)
@@ -2108,10 +2214,11 @@ class VoidCatalyst:
         self.is_owned = True
         self.owner_name = player_name
         self.weeks_owned = 0
-        self.players_owned_this_cycle.add(player_name)
+        owned = self.players_owned_this_cycle
+        owned.add(player_name)
 
         # Check if cycle will reset after this purchase
-        if len(self.players_owned_this_cycle) >= len(all_human_players):
+        if len(owned) >= len(all_human_players):
             cycle_msg = " [All players have now owned it - cycle will reset when it's available again]"
         else:
             cycle_msg = ""
@@ -2167,6 +2274,14 @@ class VoidCatalyst:
 class Player:
     """Represents a player in the game"""
 
+    # HedgeFund adds its own NPC state, so subclasses keep a __dict__
+    __slots__ = ('name', 'cash', 'portfolio', 'treasury_bonds',
+                 'quantum_singularity_units', 'elf_queen_water_vials', 'void_stocks_shares',
+                 'void_stocks_purchases', 'void_catalyst_owned',
+                 'borrowed_amount', 'max_leverage_ratio', 'interest_rate_weekly', 'collateral_deposited',
+                 'slippage_bank_debt', 'slippage_bank_interest_rate',
+                 'short_positions', 'short_borrow_fee_weekly')
+
     def __init__(self, name: str, starting_cash: float = 100000.0):
         self.name = name
         self.cash = starting_cash
@@ -2176,7 +2291,7 @@ class Player:
         self.quantum_singularity_units = 0  # Permanent investment
         self.elf_queen_water_vials = 0  # Elf Queen's "Water"
         self.void_stocks_shares = 0  # Void Stocks shares
-        self.void_stocks_purchases = []  # List of void stock purchase batches: {'purchase_week': int, 'shares': int, 'void_state_count': int}
+        self.void_stocks_purchases: deque = deque()  # Void stock purchase batches, oldest first: {'purchase_week': int, 'shares': int, 'void_state_count': int}
         self.void_catalyst_owned = False  # Void Catalyst (only 1 exists)
         # Leverage system
         self.borrowed_amount = 0.0
@@ -2217,20 +2332,8 @@ class Player:
             if companies is None or treasury is None:
                 return False, "Cannot calculate leverage without company data!"
 
-        # Calculate shares we can buy (iterative approach for slippage)
-        # We need to find how many shares we can buy with total_investment considering slippage
-        shares = total_investment / company.price  # Initial estimate
-
-        # Iteratively refine to account for slippage
-        for _ in range(5):  # A few iterations should converge
-            slippage_factor = company.calculate_slippage(shares, is_buy=True, slippage_multiplier=1.0)
-            effective_price = company.price * slippage_factor
-            shares = total_investment / effective_price
-
-        # Final calculation
-        slippage_factor = company.calculate_slippage(shares, is_buy=True, slippage_multiplier=1.0)
-        effective_price = company.price * slippage_factor
-        actual_cost = effective_price * shares
+        # Calculate shares we can buy with total_investment considering slippage
+        shares, slippage_factor = company.shares_for_amount(total_investment, is_buy=True, slippage_multiplier=1.0)
 
         # Execute the trade
         self.cash -= dollar_amount
@@ -2242,10 +2345,8 @@ class Player:
         else:
             self.portfolio[company.name] = shares
 
-        # Apply market impact (buying pushes price up)
-        old_price = company.price
-        new_price = company.apply_market_impact(shares, is_buy=True)
-        company.price = new_price
+        # Fill at the slipped price and apply market impact (buying pushes price up)
+        old_price, effective_price, new_price = company.execute_trade(shares, is_buy=True, slippage_factor=slippage_factor)
         price_impact = new_price - old_price
 
         # Build message
@@ -2285,18 +2386,11 @@ class Player:
             return False, "Specify either dollar_amount or shares, not both!"
 
         if dollar_amount is not None:
-            # Calculate shares from dollar amount (iterative for slippage)
-            shares_to_sell = dollar_amount / company.price  # Initial estimate
-
-            # Iteratively refine
-            for _ in range(5):
-                if shares_to_sell > owned_shares:
-                    shares_to_sell = owned_shares
-                    break
-                slippage_factor = company.calculate_slippage(shares_to_sell, is_buy=False, slippage_multiplier=1.0)
-                effective_price = company.price * slippage_factor
-                shares_to_sell = dollar_amount / effective_price
-
+            # Calculate shares from dollar amount (accounting for slippage)
+            if dollar_amount / company.price >= owned_shares:
+                shares_to_sell = owned_shares  # Can't raise that much even before slippage
+            else:
+                shares_to_sell, _ = company.shares_for_amount(dollar_amount, is_buy=False, slippage_multiplier=1.0)
             shares_to_sell = min(shares_to_sell, owned_shares)
         elif shares is not None:
             shares_to_sell = shares
@@ -2309,22 +2403,16 @@ class Player:
         if shares_to_sell > owned_shares:
             return False, f"You don't own that many shares! You own {owned_shares:.4f} shares."
 
-        # Calculate effective price with slippage
-        old_price = company.price
-        slippage_factor = company.calculate_slippage(shares_to_sell, is_buy=False, slippage_multiplier=1.0)
-        effective_price = old_price * slippage_factor
+        # Fill at the slipped price and apply market impact (selling pushes price down)
+        old_price, effective_price, new_price = company.execute_trade(shares_to_sell, is_buy=False)
         total_value = effective_price * shares_to_sell
+        price_impact = old_price - new_price
 
         self.cash += total_value
         self.portfolio[company.name] -= shares_to_sell
         if self.portfolio[company.name] < 0.0001:  # Clean up very small amounts
             del self.portfolio[company.name]
 
-        # Apply market impact (selling pushes price down)
-        new_price = company.apply_market_impact(shares_to_sell, is_buy=False)
-        company.price = new_price
-        price_impact = old_price - new_price
-
         # Calculate and show slippage impact
         slippage_loss = (old_price - effective_price) * shares_to_sell
 
@@ -2345,21 +2433,21 @@ class Player:
         if shares <= 0:
             return False, "Invalid number of shares!"
 
-        # Calculate effective price with slippage (selling borrowed shares)
-        old_price = company.price
-        slippage_factor = company.calculate_slippage(shares, is_buy=False, slippage_multiplier=1.0)
-        effective_price = old_price * slippage_factor
-        total_proceeds = effective_price * shares
-
         # Check margin requirement: need equity >= 1.5x the short position value
         # This is the initial margin requirement for short selling
         equity = self.calculate_equity(companies, treasury, quantum_singularity, elf_queen_water, void_stocks, void_catalyst)
-        short_value = old_price * shares
+        short_value = company.price * shares
         required_margin = short_value * 1.5
 
         if equity < required_margin:
             return False, f"Insufficient equity for short sale! Need ${required_margin:.2f} equity, have ${equity:.2f}"
 
+        # Sell the borrowed shares at the slipped price and apply market impact
+        # (short selling = selling, pushes price down)
+        old_price, effective_price, new_price = company.execute_trade(shares, is_buy=False)
+        total_proceeds = effective_price * shares
+        price_impact = old_price - new_price
+
         # Execute short sale
         self.cash += total_proceeds
         if company.name in self.short_positions:
@@ -2367,11 +2455,6 @@ class Player:
         else:
             self.short_positions[company.name] = shares
 
-        # Apply market impact (short selling = selling, pushes price down)
-        new_price = company.apply_market_impact(shares, is_buy=False)
-        company.price = new_price
-        price_impact = old_price - new_price
-
         # Calculate and show slippage impact
         slippage_loss = (old_price - effective_price) * shares
 
@@ -2393,25 +2476,22 @@ class Player:
             return False, "You don't have that many shares shorted!"
 
         # Calculate effective price with slippage (buying to cover)
-        old_price = company.price
         slippage_factor = company.calculate_slippage(shares, is_buy=True, slippage_multiplier=1.0)
-        effective_price = old_price * slippage_factor
-        total_cost = effective_price * shares
+        total_cost = company.price * slippage_factor * shares
 
         if total_cost > self.cash:
             return False, "Insufficient funds to cover short position!"
 
+        # Fill at the slipped price and apply market impact (covering = buying, pushes price up)
+        old_price, effective_price, new_price = company.execute_trade(shares, is_buy=True, slippage_factor=slippage_factor)
+        price_impact = new_price - old_price
+
         # Execute cover
         self.cash -= total_cost
         self.short_positions[company.name] -= shares
         if self.short_positions[company.name] == 0:
             del self.short_positions[company.name]
 
-        # Apply market impact (covering = buying, pushes price up)
-        new_price = company.apply_market_impact(shares, is_buy=True)
-        company.price = new_price
-        price_impact = new_price - old_price
-
         # Calculate and show slippage impact
         slippage_cost = (effective_price - old_price) * shares
 
@@ -2511,20 +2591,17 @@ class Player:
 
         # Remove shares from purchases (FIFO - oldest first)
         remaining_to_remove = shares
-        purchases_to_keep = []
-        for purchase in self.void_stocks_purchases:
+        purchases = self.void_stocks_purchases
+        while remaining_to_remove > 0 and purchases:
+            purchase = purchases[0]
             if remaining_to_remove >= purchase['shares']:
                 # Remove this entire purchase
                 remaining_to_remove -= purchase['shares']
-            elif remaining_to_remove > 0:
+                purchases.popleft()
+            else:
                 # Partially remove from this purchase
                 purchase['shares'] -= remaining_to_remove
                 remaining_to_remove = 0
-                purchases_to_keep.append(purchase)
-            else:
-                # Keep this purchase intact
-                purchases_to_keep.append(purchase)
-        self.void_stocks_purchases = purchases_to_keep
 
         if void_stocks.is_void_week:
             return True, f"Sale successful! Sold {shares} Void Stocks for ${total_value:.2f} (VOID STATE - worthless!)"
@@ -2542,21 +2619,19 @@ class Player:
             return messages
 
         # Increment void state counter for all purchases
-        purchases_to_keep = []
+        purchases = self.void_stocks_purchases
         total_deleted_shares = 0
 
-        for purchase in self.void_stocks_purchases:
+        for purchase in purchases:
             purchase['void_state_count'] += 1
 
-            if purchase['void_state_count'] >= 5:
-                # Delete these shares - they've gone through 5 void states
-                total_deleted_shares += purchase['shares']
-                messages.append(f"💀 VOID DELETION: {purchase['shares']} Void Stock shares (purchased in week {purchase['purchase_week']}) have been consumed by the void!")
-            else:
-                # Keep this purchase
-                purchases_to_keep.append(purchase)
+        # Every purchase is counted together, so the oldest ones always hit 5 first
+        while purchases and purchases[0]['void_state_count'] >= 5:
+            # Delete these shares - they've gone through 5 void states
+            purchase = purchases.popleft()
+            total_deleted_shares += purchase['shares']
+            messages.append(f"💀 VOID DELETION: {purchase['shares']} Void Stock shares (purchased in week {purchase['purchase_week']}) have been consumed by the void!")
 
-        self.void_stocks_purchases = purchases_to_keep
         self.void_stocks_shares -= total_deleted_shares
 
         if total_deleted_shares > 0:
@@ -2579,7 +2654,7 @@ class Player:
 
         return len(at_risk_purchases) > 0, at_risk_purchases
 
-    def buy_void_catalyst(self, void_catalyst: VoidCatalyst, all_human_players: List[str]) -> Tuple[bool, str]:
+    def buy_void_catalyst(self, void_catalyst: VoidCatalyst, all_human_players: Collection[str]) -> Tuple[bool, str]:
         """Buy the Void Catalyst (only 1 exists)"""
         if self.void_catalyst_owned:
             return False, "You already own the Void Catalyst!"
@@ -2627,70 +2702,55 @@ class Player:
             return income
         return 0.0
 
-    def calculate_net_worth(self, companies: Dict[str, Company], treasury: Treasury, quantum_singularity: QuantumSingularity = None, elf_queen_water: ElfQueenWater = None, void_stocks: VoidStocks = None, void_catalyst: VoidCatalyst = None) -> float:
-        """Calculate total net worth (cash + stocks + bonds - short obligations)"""
-        net_worth = self.cash
-
-        # Add long stock value
+    def _valuations(self, companies: Dict[str, Company], treasury: Treasury, quantum_singularity: QuantumSingularity = None, elf_queen_water: ElfQueenWater = None, void_stocks: VoidStocks = None, void_catalyst: VoidCatalyst = None) -> Tuple[float, float, float]:
+        """Value all holdings in one walk: (long stock value, short obligations, bonds + themed assets)"""
+        # Long stock value
+        long_value = 0.0
         for company_name, shares in self.portfolio.items():
             if company_name in companies:
-                net_worth += companies[company_name].price * shares
+                long_value += companies[company_name].price * shares
 
-        # Subtract short position obligations (liability to return borrowed shares)
+        # Short position obligations (liability to return borrowed shares)
+        short_value = 0.0
         for company_name, shares in self.short_positions.items():
             if company_name in companies:
-                net_worth -= companies[company_name].price * shares
-
-        # Add treasury value
-        net_worth += self.treasury_bonds * treasury.price
-
-        # Add themed investments
-        if quantum_singularity and self.quantum_singularity_units > 0:
-            net_worth += self.quantum_singularity_units * quantum_singularity.price
-        if elf_queen_water and self.elf_queen_water_vials > 0:
-            net_worth += self.elf_queen_water_vials * elf_queen_water.price
-        if void_stocks and self.void_stocks_shares > 0:
-            net_worth += self.void_stocks_shares * void_stocks.price
+                short_value += companies[company_name].price * shares
+
+        # Treasury value
+        other_value = self.treasury_bonds * treasury.price
+
+        # Themed investments (a zero holding just adds 0.0, so only the missing-asset check is needed)
+        if quantum_singularity:
+            other_value += self.quantum_singularity_units * quantum_singularity.price
+        if elf_queen_water:
+            other_value += self.elf_queen_water_vials * elf_queen_water.price
+        if void_stocks:
+            other_value += self.void_stocks_shares * void_stocks.price
         if void_catalyst and self.void_catalyst_owned:
-            net_worth += void_catalyst.price
+            other_value += void_catalyst.price
 
-        return net_worth
+        return long_value, short_value, other_value
+
+    def calculate_net_worth(self, companies: Dict[str, Company], treasury: Treasury, quantum_singularity: QuantumSingularity = None, elf_queen_water: ElfQueenWater = None, void_stocks: VoidStocks = None, void_catalyst: VoidCatalyst = None) -> float:
+        """Calculate total net worth (cash + stocks + bonds - short obligations)"""
+        long_value, short_value, other_value = self._valuations(companies, treasury, quantum_singularity, elf_queen_water, void_stocks, void_catalyst)
+        return self.cash + long_value - short_value + other_value
 
     def calculate_equity(self, companies: Dict[str, Company], treasury: Treasury, quantum_singularity: QuantumSingularity = None, elf_queen_water: ElfQueenWater = None, void_stocks: VoidStocks = None, void_catalyst: VoidCatalyst = None) -> float:
         """Calculate equity (net worth minus debt)"""
-        return self.calculate_net_worth(companies, treasury, quantum_singularity, elf_queen_water, void_stocks, void_catalyst) - self.borrowed_amount - self.slippage_bank_debt
+        long_value, short_value, other_value = self._valuations(companies, treasury, quantum_singularity, elf_queen_water, void_stocks, void_catalyst)
+        return self.cash + long_value - short_value + other_value - self.borrowed_amount - self.slippage_bank_debt
 
     def calculate_total_assets(self, companies: Dict[str, Company], treasury: Treasury, quantum_singularity: QuantumSingularity = None, elf_queen_water: ElfQueenWater = None, void_stocks: VoidStocks = None, void_catalyst: VoidCatalyst = None) -> float:
         """Calculate total portfolio value (not including cash, only investments)"""
-        assets = 0.0
-
-        # Add stock value
-        for company_name, shares in self.portfolio.items():
-            if company_name in companies:
-                assets += companies[company_name].price * shares
-
-        # Add treasury value
-        assets += self.treasury_bonds * treasury.price
-
-        # Add themed investments
-        if quantum_singularity and self.quantum_singularity_units > 0:
-            assets += self.quantum_singularity_units * quantum_singularity.price
-        if elf_queen_water and self.elf_queen_water_vials > 0:
-            assets += self.elf_queen_water_vials * elf_queen_water.price
-        if void_stocks and self.void_stocks_shares > 0:
-            assets += self.void_stocks_shares * void_stocks.price
-        if void_catalyst and self.void_catalyst_owned:
-            assets += void_catalyst.price
-
-        return assets
+        long_value, _, other_value = self._valuations(companies, treasury, quantum_singularity, elf_queen_water, void_stocks, void_catalyst)
+        return long_value + other_value
 
     def borrow_money(self, amount: float, companies: Dict[str, Company], treasury: Treasury, quantum_singularity: 'QuantumSingularity' = None, elf_queen_water: 'ElfQueenWater' = None, void_stocks: 'VoidStocks' = None, void_catalyst: 'VoidCatalyst' = None) -> Tuple[bool, str]:
         """Borrow money using leverage"""
         if amount <= 0:
             return False, "Invalid amount!"
 
-        equity = self.calculate_equity(companies, treasury, quantum_singularity, elf_queen_water, void_stocks, void_catalyst)
-
         # No borrowing limit - players can borrow as much as they want (margin call will trigger if they go too far)
         self.borrowed_amount += amount
         self.cash += amount
@@ -2704,9 +2764,7 @@ class Player:
         if amount > self.cash:
             return False, "Insufficient cash!"
 
-        if amount > self.borrowed_amount:
-            amount = self.borrowed_amount
-
+        amount = min(amount, self.borrowed_amount)  # Can't repay more than is owed
         self.borrowed_amount -= amount
         self.cash -= amount
         return True, f"Successfully repaid ${amount:.2f}! Remaining debt: ${self.borrowed_amount:.2f}"
@@ -2745,9 +2803,7 @@ class Player:
         if amount > self.cash:
             return False, f"Insufficient cash! You have ${self.cash:.2f}"
 
-        if amount > self.slippage_bank_debt:
-            amount = self.slippage_bank_debt
-
+        amount = min(amount, self.slippage_bank_debt)  # Can't repay more than is owed
         self.slippage_bank_debt -= amount
         self.cash -= amount
         slippage_bank[0] += amount
@@ -2821,11 +2877,15 @@ class Player:
 
     def apply_short_borrow_fees(self, companies: Dict[str, Company]) -> float:
         """Apply weekly borrow fees for short positions"""
+        if not self.short_positions:
+            return 0.0  # Most players have no shorts open
+
         total_fees = 0.0
+        fee_rate = self.short_borrow_fee_weekly / 100
         for company_name, shares in self.short_positions.items():
             if company_name in companies:
                 position_value = companies[company_name].price * shares
-                fee = position_value * (self.short_borrow_fee_weekly / 100)
+                fee = position_value * fee_rate
                 total_fees += fee
 
         if total_fees > 0:
@@ -2840,9 +2900,14 @@ class Player:
         if not has_risk:
             return False
 
-        # Calculate equity including all assets
-        equity = self.calculate_equity(companies, treasury, quantum_singularity, elf_queen_water, void_stocks, void_catalyst)
+        # Calculate equity including all assets (the same walk gives the short position value)
+        long_value, short_value, other_value = self._valuations(companies, treasury, quantum_singularity, elf_queen_water, void_stocks, void_catalyst)
+        equity = self.cash + long_value - short_value + other_value - self.borrowed_amount - self.slippage_bank_debt
 
+        return self._margin_call_triggered(equity, short_value)
+
+    def _margin_call_triggered(self, equity: float, total_short_value: float) -> bool:
+        """Margin call test on already-computed equity and short position value"""
         # Check leverage-based margin call
         if self.borrowed_amount > 0:
             total_position = equity + self.borrowed_amount
@@ -2856,11 +2921,6 @@ class Player:
         # Check short position maintenance margin
         # Require equity >= 1.25x short position value (125% maintenance margin)
         if len(self.short_positions) > 0:
-            total_short_value = 0.0
-            for company_name, shares in self.short_positions.items():
-                if company_name in companies:
-                    total_short_value += companies[company_name].price * shares
-
             required_maintenance = total_short_value * 1.25
             if equity < required_maintenance:
                 return True
@@ -2879,56 +2939,60 @@ class Player:
 
         actions.append(f"🚨 FORCED LIQUIDATION for {self.name} - Margin call not resolved")
 
-        # Cover short positions first (highest risk due to unlimited loss potential)
-        # Sort by value (cover largest short positions first to reduce risk fastest)
+        # Prices don't move while positions are force-closed, and every step below swaps cash
+        # for an asset or liability of the same value (cover, sell, repay), so equity stays put.
+        # Compute it once and only track the short value that the maintenance margin depends on.
+        equity = self.calculate_equity(companies, treasury, quantum_singularity, elf_queen_water, void_stocks, void_catalyst)
         short_positions = [(name, shares, companies[name].price * shares)
                           for name, shares in self.short_positions.items()]
+        short_value = sum(value for _, _, value in short_positions)
+
+        # Cover short positions first (highest risk due to unlimited loss potential)
+        # Sort by value (cover largest short positions first to reduce risk fastest)
         short_positions.sort(key=lambda x: x[2], reverse=True)
 
         for company_name, shares, value in short_positions:
-            if not self.check_margin_call(companies, treasury, quantum_singularity, elf_queen_water, void_stocks, void_catalyst):
+            if not self._margin_call_triggered(equity, short_value):
                 break  # Margin call resolved
 
-            company = companies[company_name]
-            cost = shares * company.price
+            cost = value  # Already shares * price (prices don't move during liquidation)
 
             if cost <= self.cash:
                 # Cover the short position
                 self.cash -= cost
-                self.short_positions[company_name] = 0
+                del self.short_positions[company_name]  # Safe: we're looping over the sorted copy
+                short_value -= cost
                 actions.append(f"   Covered {shares} shorted shares of {company_name} for ${cost:.2f}")
 
-        # Clean up empty short positions
-        self.short_positions = {k: v for k, v in self.short_positions.items() if v > 0}
-
         # Liquidate long stocks second
         # Sort by value (sell largest positions first to minimize transactions)
         stock_positions = [(name, shares, companies[name].price * shares)
                           for name, shares in self.portfolio.items()]
         stock_positions.sort(key=lambda x: x[2], reverse=True)
 
+        total_repaid = 0.0
         for company_name, shares, value in stock_positions:
-            if not self.check_margin_call(companies, treasury, quantum_singularity, elf_queen_water, void_stocks, void_catalyst):
+            if not self._margin_call_triggered(equity, short_value):
                 break  # Margin call resolved
 
-            company = companies[company_name]
-            proceeds = shares * company.price
+            proceeds = value  # Already shares * price
             self.cash += proceeds
-            self.portfolio[company_name] = 0
+            del self.portfolio[company_name]
             actions.append(f"   Sold {shares} shares of {company_name} for ${proceeds:.2f}")
 
-            # Use proceeds to repay loan
+            # Use proceeds to repay loan right away - the lower debt is what lets the
+            # leverage check clear, so the repayment can't wait until after the loop
             repayment = min(self.cash, self.borrowed_amount)
             if repayment > 0:
                 self.borrowed_amount -= repayment
                 self.cash -= repayment
-                actions.append(f"   Repaid ${repayment:.2f} of loan")
+                total_repaid += repayment
 
-        # Clean up empty positions
-        self.portfolio = {k: v for k, v in self.portfolio.items() if v > 0}
+        if total_repaid > 0:
+            actions.append(f"   Repaid ${total_repaid:.2f} of loan from stock sales")
 
         # If still in margin call, liquidate treasury bonds
-        if self.check_margin_call(companies, treasury, quantum_singularity, elf_queen_water, void_stocks, void_catalyst) and self.treasury_bonds > 0:
+        if self._margin_call_triggered(equity, short_value) and self.treasury_bonds > 0:
             proceeds = self.treasury_bonds * treasury.price
             self.cash += proceeds
             actions.append(f"   Sold {self.treasury_bonds} treasury bonds for ${proceeds:.2f}")
@@ -2966,7 +3030,7 @@ class Player:
             'quantum_singularity_units': self.quantum_singularity_units,
             'elf_queen_water_vials': self.elf_queen_water_vials,
             'void_stocks_shares': self.void_stocks_shares,
-            'void_stocks_purchases': self.void_stocks_purchases,
+            'void_stocks_purchases': list(self.void_stocks_purchases),
             'void_catalyst_owned': self.void_catalyst_owned,
             'collateral_deposited': self.collateral_deposited,
             'slippage_bank_debt': self.slippage_bank_debt
@@ -2986,7 +3050,7 @@ class Player:
         player.quantum_singularity_units = data.get('quantum_singularity_units', 0)  # Default to 0 for backwards compatibility
         player.elf_queen_water_vials = data.get('elf_queen_water_vials', 0)
         player.void_stocks_shares = data.get('void_stocks_shares', 0)
-        player.void_stocks_purchases = data.get('void_stocks_purchases', [])  # Default to empty list for backwards compatibility
+        player.void_stocks_purchases = deque(data.get('void_stocks_purchases', []))  # Default to empty for backwards compatibility
         player.void_catalyst_owned = data.get('void_catalyst_owned', False)
         player.collateral_deposited = data.get('collateral_deposited', 0.0)  # Default to 0.0 for backwards compatibility
         player.slippage_bank_debt = data.get('slippage_bank_debt', 0.0)  # Default to 0.0 for backwards compatibility
@@ -2999,10 +3063,14 @@ class Player:
         print(f"{'='*60}")
         print(f"Cash: ${self.cash:.2f}")
 
+        # Value holdings once; equity, the short warning and net worth all derive from it
+        long_value, total_short_value, other_value = self._valuations(companies, treasury, quantum_singularity, elf_queen_water, void_stocks, void_catalyst)
+        net_worth = self.cash + long_value - total_short_value + other_value
+        equity = net_worth - self.borrowed_amount - self.slippage_bank_debt
+
         # Show leverage info
         if self.borrowed_amount > 0:
             print(f"💳 Borrowed (Leverage): ${self.borrowed_amount:.2f}")
-            equity = self.calculate_equity(companies, treasury, quantum_singularity, elf_queen_water, void_stocks, void_catalyst)
             print(f"💰 Equity (Net - Debt): ${equity:.2f}")
             current_leverage = self.borrowed_amount / max(0.01, equity)
             print(f"📊 Leverage Ratio: {current_leverage:.2f}x")
@@ -3025,27 +3093,20 @@ class Player:
                 print(f"   Distance to Margin Call: {distance_to_margin_call:.1f}%")
 
         # Show short position maintenance margin warning
-        if len(self.short_positions) > 0:
-            total_short_value = 0.0
-            for company_name, shares in self.short_positions.items():
-                if company_name in companies:
-                    total_short_value += companies[company_name].price * shares
-
-            if total_short_value > 0:
-                equity = self.calculate_equity(companies, treasury, quantum_singularity, elf_queen_water, void_stocks, void_catalyst)
-                required_maintenance = total_short_value * 1.25
-                short_equity_ratio = (equity / required_maintenance * 100) if required_maintenance > 0 else 100
-                distance_to_short_call = short_equity_ratio - 100
+        if total_short_value > 0:
+            required_maintenance = total_short_value * 1.25
+            short_equity_ratio = (equity / required_maintenance * 100) if required_maintenance > 0 else 100
+            distance_to_short_call = short_equity_ratio - 100
 
-                if distance_to_short_call < 10:
-                    warning_icon = "🚨"
-                elif distance_to_short_call < 20:
-                    warning_icon = "⚠️"
-                else:
-                    warning_icon = "✓"
+            if distance_to_short_call < 10:
+                warning_icon = "🚨"
+            elif distance_to_short_call < 20:
+                warning_icon = "⚠️"
+            else:
+                warning_icon = "✓"
 
-                print(f"{warning_icon} Short Equity: {short_equity_ratio:.1f}% of required (Short Call at 100%)")
-                print(f"   Distance to Short Call: {distance_to_short_call:.1f}%")
+            print(f"{warning_icon} Short Equity: {short_equity_ratio:.1f}% of required (Short Call at 100%)")
+            print(f"   Distance to Short Call: {distance_to_short_call:.1f}%")
 
         # Show collateral info
         if self.collateral_deposited > 0:
@@ -3063,9 +3124,9 @@ class Player:
             print("Stocks:")
             for company_name, shares in self.portfolio.items():
                 if company_name in companies:
-                    company = companies[company_name]
-                    value = company.price * shares
-                    print(f"  {company_name}: {shares:.4f} shares @ ${company.price:.2f} = ${value:.2f}")
+                    price = companies[company_name].price
+                    value = price * shares
+                    print(f"  {company_name}: {shares:.4f} shares @ ${price:.2f} = ${value:.2f}")
         else:
             print("Stocks: None")
 
@@ -3074,9 +3135,9 @@ class Player:
             print("Short Positions (Shares Owed):")
             for company_name, shares in self.short_positions.items():
                 if company_name in companies:
-                    company = companies[company_name]
-                    obligation = company.price * shares
-                    print(f"  {company_name}: {shares} shorted @ ${company.price:.2f} = ${obligation:.2f} owed")
+                    price = companies[company_name].price
+                    obligation = price * shares
+                    print(f"  {company_name}: {shares} shorted @ ${price:.2f} = ${obligation:.2f} owed")
         else:
             print("Short Positions: None")
 
@@ -3090,34 +3151,28 @@ class Player:
         print()
         # Display themed investments
         print("Themed Investments:")
-        has_themed = False
-        if quantum_singularity and self.quantum_singularity_units > 0:
-            value = self.quantum_singularity_units * quantum_singularity.price
-            monthly_income = quantum_singularity.calculate_monthly_return(self.quantum_singularity_units)
-            print(f"  Quantum Singularity: {self.quantum_singularity_units} units @ ${quantum_singularity.price:.2f} = ${value:.2f} (${monthly_income:.2f}/month)")
-            has_themed = True
-
-        if elf_queen_water and self.elf_queen_water_vials > 0:
-            value = self.elf_queen_water_vials * elf_queen_water.price
-            print(f"  Elf Queen's \"Water\": {self.elf_queen_water_vials} vials @ ${elf_queen_water.price:.2f} = ${value:.2f}")
-            has_themed = True
-
-        if void_stocks and self.void_stocks_shares > 0:
-            value = self.void_stocks_shares * void_stocks.price
-            status = "[VOID]" if void_stocks.is_void_week else f"[{void_stocks.get_current_company_name()}]"
-            print(f"  Void Stocks: {self.void_stocks_shares} shares @ ${void_stocks.price:.2f} = ${value:.2f} {status}")
-            has_themed = True
-        if void_catalyst and self.void_catalyst_owned:
-            value = void_catalyst.price
-            weeks_left = 4 - void_catalyst.weeks_owned
-            print(f"  Void Catalyst: 1 unit @ ${void_catalyst.price:.2f} = ${value:.2f} (Auto-sells in {weeks_left} weeks)")
-            has_themed = True
-
-        if not has_themed:
-            print("  None")
+        if not (self.quantum_singularity_units or self.elf_queen_water_vials or self.void_stocks_shares or self.void_catalyst_owned):
+            print("  None")  # Nothing held, skip the per-asset checks
+        else:
+            if quantum_singularity and self.quantum_singularity_units > 0:
+                value = self.quantum_singularity_units * quantum_singularity.price
+                monthly_income = quantum_singularity.calculate_monthly_return(self.quantum_singularity_units)
+                print(f"  Quantum Singularity: {self.quantum_singularity_units} units @ ${quantum_singularity.price:.2f} = ${value:.2f} (${monthly_income:.2f}/month)")
+
+            if elf_queen_water and self.elf_queen_water_vials > 0:
+                value = self.elf_queen_water_vials * elf_queen_water.price
+                print(f"  Elf Queen's \"Water\": {self.elf_queen_water_vials} vials @ ${elf_queen_water.price:.2f} = ${value:.2f}")
+
+            if void_stocks and self.void_stocks_shares > 0:
+                value = self.void_stocks_shares * void_stocks.price
+                status = "[VOID]" if void_stocks.is_void_week else f"[{void_stocks.get_current_company_name()}]"
+                print(f"  Void Stocks: {self.void_stocks_shares} shares @ ${void_stocks.price:.2f} = ${value:.2f} {status}")
+            if void_catalyst and self.void_catalyst_owned:
+                value = void_catalyst.price
+                weeks_left = 4 - void_catalyst.weeks_owned
+                print(f"  Void Catalyst: 1 unit @ ${void_catalyst.price:.2f} = ${value:.2f} (Auto-sells in {weeks_left} weeks)")
 
         print()
-        net_worth = self.calculate_net_worth(companies, treasury, quantum_singularity, elf_queen_water, void_stocks, void_catalyst)
         print(f"Total Net Worth: ${net_worth:.2f}")
         print(f"{'='*60}")
 
@@ -3147,6 +3202,88 @@ class MarketCycleType(Enum):
     VOID_BLESSING = "void_blessing"
 
 
+# Saved cycle_type strings -> MarketCycleType, for a plain dict lookup when loading
+_CYCLE_TYPE_BY_VALUE: Dict[str, MarketCycleType] = {cycle_type.value: cycle_type for cycle_type in MarketCycleType}
+
+# Cycle groupings the hedge fund strategies react to (built once, not per turn)
+_EUPHORIC_CYCLES = (MarketCycleType.BULL_MARKET, MarketCycleType.RECOVERY)
+_BULLISH_CYCLES = _EUPHORIC_CYCLES + (MarketCycleType.TECH_BOOM,)
+_FEAR_CYCLES = (MarketCycleType.MARKET_CRASH, MarketCycleType.RECESSION)
+_BEARISH_CYCLES = _FEAR_CYCLES + (MarketCycleType.BEAR_MARKET,)
+
+# Cycle effects that depend only on industry: cycle -> ({industry: band}, default band)
+# A band is (sign, low, high) and the weekly effect is sign * random.uniform(low, high)
+_CYCLE_EFFECT_BANDS: Dict[MarketCycleType, Tuple[Dict[str, Tuple[float, float, float]], Tuple[float, float, float]]] = {
+    MarketCycleType.BULL_MARKET: ({
+        "Rare Fantasy Goods": (1.0, 1.0, 3.0),  # Ultra-wealthy always buy, bull or not
+        "Divine Services": (1.0, 4.0, 8.0),  # People feel blessed, share prosperity with deities
+        "Magical Publishing": (1.0, 3.5, 6.0),  # More disposable income for books and grimoires
+    }, (1.0, 3.0, 7.0)),
+    MarketCycleType.BEAR_MARKET: ({
+        "Rare Fantasy Goods": (1.0, 2.0, 6.0),  # Counter-cyclical: rare luxury goods as safe haven
+        "Divine Services": (1.0, 3.0, 7.0),  # Counter-cyclical: divine help during hard times
+        "Magical Publishing": (1.0, -1.0, 2.0),  # Self-help buying vs less discretionary spending
+    }, (-1.0, 2.0, 5.0)),
+    MarketCycleType.RECESSION: ({
+        "Rare Fantasy Goods": (1.0, -1.0, 2.0),  # Ultra-wealthy unaffected by recession
+        "Divine Services": (1.0, 5.0, 10.0),  # Counter-cyclical: desperation drives people to seek miracles
+        "Magical Publishing": (-1.0, 1.0, 3.0),  # Discretionary, but the educational aspect helps
+    }, (-1.0, 4.0, 8.0)),
+    MarketCycleType.ENERGY_INFLATION: ({
+        "Energy": (1.0, 4.0, 8.0),
+        "Mana Extraction": (1.0, 5.0, 10.0),  # Mana becomes more valuable during energy crises
+        "Rare Fantasy Goods": (1.0, 8.0, 15.0),  # Ultimate inflation hedge - hard assets
+        "Divine Services": (-1.0, 1.0, 3.0),  # People pray for relief but can't afford services
+        "Magical Publishing": (1.0, -0.5, 2.0),  # Paper costs rise, but knowledge hedges inflation
+    }, (-1.0, 2.0, 4.0)),
+    MarketCycleType.MARKET_CRASH: ({
+        "Golem Manufacturing": (-1.0, 12.0, 20.0),  # Golems crash HARD (fear of automation)
+        "Mana Extraction": (-1.0, 10.0, 18.0),  # Extreme volatility
+        "Rare Fantasy Goods": (1.0, -5.0, 8.0),  # Chaotic - sometimes a flight to rarity
+        "Divine Services": (1.0, 8.0, 15.0),  # Counter-cyclical: panic drives people to divine intervention
+        "Magical Publishing": (1.0, 1.0, 4.0),  # "How to Survive a Market Crash" sells
+    }, (-1.0, 8.0, 15.0)),
+    MarketCycleType.RECOVERY: ({
+        "Golem Manufacturing": (1.0, 3.0, 6.0),  # Golems recover slower (trust issues)
+        "Rare Fantasy Goods": (1.0, 0.0, 3.0),  # Operates outside normal cycles
+        "Divine Services": (1.0, 2.0, 5.0),  # Less need for emergency prayers
+        "Magical Publishing": (1.0, 4.0, 8.0),  # Normal recovery
+    }, (1.0, 5.0, 10.0)),
+    MarketCycleType.TECH_BOOM: ({
+        "Technology": (1.0, 7.0, 12.0),
+        "Electronics": (1.0, 7.0, 12.0),
+        "Golem Manufacturing": (1.0, 10.0, 15.0),  # Automation hype
+        "Mana Extraction": (1.0, 6.0, 10.0),  # Clean energy hype
+        "Rare Fantasy Goods": (1.0, -1.0, 2.0),  # Cosmic artifact market ignores tech
+        "Divine Services": (-1.0, 2.0, 5.0),  # People turn to tech instead of faith
+        "Magical Publishing": (1.0, 5.0, 9.0),  # Digital grimoires and e-books boom
+    }, (1.0, 2.0, 4.0)),
+    # Sector-specific events
+    MarketCycleType.TECH_CORRECTION: ({
+        "Technology": (-1.0, 8.0, 15.0),  # Tech crashes hard
+        "Electronics": (-1.0, 8.0, 15.0),
+    }, (1.0, -1.0, 2.0)),  # Others slight down to slight up
+    MarketCycleType.ENERGY_CRISIS: ({
+        "Energy": (1.0, 8.0, 14.0),  # Energy surges
+        "Golem Manufacturing": (-1.0, 3.0, 6.0),  # Heavy energy users hurt most
+    }, (-1.0, 1.0, 3.0)),
+    MarketCycleType.FINANCIAL_SECTOR_BOOM: ({
+        "Finance": (1.0, 6.0, 11.0),
+    }, (1.0, 1.0, 3.0)),
+    MarketCycleType.RETAIL_COLLAPSE: ({
+        "Retail": (-1.0, 10.0, 18.0),
+    }, (-1.0, 1.0, 3.0)),
+    MarketCycleType.HEALTHCARE_RALLY: ({
+        "Pharmaceuticals": (1.0, 6.0, 11.0),
+    }, (1.0, 0.5, 2.5)),
+    MarketCycleType.MANUFACTURING_SLUMP: ({
+        "Golem Manufacturing": (-1.0, 7.0, 13.0),
+    }, (-1.0, 1.0, 3.0)),
+    # Moderate broad correction
+    MarketCycleType.PROFIT_TAKING: ({}, (-1.0, 3.0, 7.0)),
+}
+
+
 @dataclass
 class ActiveMarketCycle:
     """Represents an active market cycle"""
@@ -3168,7 +3305,7 @@ class ActiveMarketCycle:
     def from_dict(data: dict) -> 'ActiveMarketCycle':
         """Deserialize ActiveMarketCycle from dictionary"""
         return ActiveMarketCycle(
-            cycle_type=MarketCycleType(data['cycle_type']),
+            cycle_type=_CYCLE_TYPE_BY_VALUE[data['cycle_type']],
             weeks_remaining=data['weeks_remaining'],
             headline=data['headline'],
             description=data['description']
@@ -3178,6 +3315,182 @@ class ActiveMarketCycle:
 class MarketCycle:
     """Handles major market cycles (economic events every 6 months)"""
 
+    # Positive cycles that inflate prices
+    POSITIVE_CYCLES = frozenset({
+        MarketCycleType.TECH_BOOM,
+        MarketCycleType.BULL_MARKET,
+        MarketCycleType.RECOVERY,
+        MarketCycleType.FINANCIAL_SECTOR_BOOM,
+        MarketCycleType.HEALTHCARE_RALLY
+    })
+
+    # Correction cycles that bring prices down
+    CORRECTION_CYCLES = frozenset({
+        MarketCycleType.BUBBLE_POP,
+        MarketCycleType.TECH_CORRECTION,
+        MarketCycleType.PROFIT_TAKING,
+        MarketCycleType.BEAR_MARKET,
+        MarketCycleType.MARKET_CRASH
+    })
+
+    # Cycle selection weights by market regime (see trigger_cycle)
+    # Extreme overvaluation (P/E > 50 after a boom) - very high chance of correction
+    EXTREME_PE_CYCLE_WEIGHTS = {
+        MarketCycleType.BUBBLE_POP: 30,
+        MarketCycleType.TECH_CORRECTION: 25,
+        MarketCycleType.PROFIT_TAKING: 20,
+        MarketCycleType.BEAR_MARKET: 15,
+        MarketCycleType.SECTOR_ROTATION: 10
+    }
+    # Moderate overvaluation (P/E 35-50 after a boom) - increased correction chance
+    MODERATE_PE_CYCLE_WEIGHTS = {
+        MarketCycleType.PROFIT_TAKING: 25,
+        MarketCycleType.TECH_CORRECTION: 20,
+        MarketCycleType.BUBBLE_POP: 15,
+        MarketCycleType.SECTOR_ROTATION: 15,
+        MarketCycleType.BEAR_MARKET: 10,
+        MarketCycleType.ENERGY_INFLATION: 10,
+        MarketCycleType.BULL_MARKET: 5  # Small chance to continue
+    }
+    # Mild overvaluation (P/E 30-35 after a boom) - small correction chance
+    MILD_PE_CYCLE_WEIGHTS = {
+        MarketCycleType.SECTOR_ROTATION: 20,
+        MarketCycleType.PROFIT_TAKING: 15,
+        MarketCycleType.BULL_MARKET: 15,
+        MarketCycleType.ENERGY_INFLATION: 15,
+        MarketCycleType.TECH_CORRECTION: 10,
+        MarketCycleType.ENERGY_CRISIS: 10,
+        MarketCycleType.HEALTHCARE_RALLY: 10,
+        MarketCycleType.BEAR_MARKET: 5
+    }
+    # Undervalued market after a correction - favor recovery
+    RECOVERY_CYCLE_WEIGHTS = {
+        MarketCycleType.RECOVERY: 30,
+        MarketCycleType.BULL_MARKET: 20,
+        MarketCycleType.HEALTHCARE_RALLY: 15,
+        MarketCycleType.FINANCIAL_SECTOR_BOOM: 15,
+        MarketCycleType.TECH_BOOM: 10,
+        MarketCycleType.SECTOR_ROTATION: 10
+    }
+    # Normal conditions - balanced mix
+    NORMAL_CYCLE_WEIGHTS = {
+        # Broad market events
+        MarketCycleType.BULL_MARKET: 12,
+        MarketCycleType.BEAR_MARKET: 10,
+        MarketCycleType.SECTOR_ROTATION: 12,
+        MarketCycleType.ENERGY_INFLATION: 10,
+        # Sector-specific events
+        MarketCycleType.TECH_BOOM: 8,
+        MarketCycleType.TECH_CORRECTION: 8,
+        MarketCycleType.ENERGY_CRISIS: 8,
+        MarketCycleType.FINANCIAL_SECTOR_BOOM: 7,
+        MarketCycleType.HEALTHCARE_RALLY: 7,
+        MarketCycleType.RETAIL_COLLAPSE: 6,
+        MarketCycleType.MANUFACTURING_SLUMP: 6,
+        # Major events (less common)
+        MarketCycleType.RECOVERY: 2,
+        MarketCycleType.RECESSION: 2,
+        MarketCycleType.MARKET_CRASH: 1,
+        MarketCycleType.BUBBLE_POP: 1,
+        # Void events (ultra rare - ~1% chance each)
+        MarketCycleType.VOID_INVASION: 1,
+        MarketCycleType.VOID_BLESSING: 1
+    }
+
+    # (cycles, cumulative weights) for each regime, built once here instead of on every trigger
+    EXTREME_PE_CYCLE_CHOICES = (tuple(EXTREME_PE_CYCLE_WEIGHTS), tuple(accumulate(EXTREME_PE_CYCLE_WEIGHTS.values())))
+    MODERATE_PE_CYCLE_CHOICES = (tuple(MODERATE_PE_CYCLE_WEIGHTS), tuple(accumulate(MODERATE_PE_CYCLE_WEIGHTS.values())))
+    MILD_PE_CYCLE_CHOICES = (tuple(MILD_PE_CYCLE_WEIGHTS), tuple(accumulate(MILD_PE_CYCLE_WEIGHTS.values())))
+    RECOVERY_CYCLE_CHOICES = (tuple(RECOVERY_CYCLE_WEIGHTS), tuple(accumulate(RECOVERY_CYCLE_WEIGHTS.values())))
+    NORMAL_CYCLE_CHOICES = (tuple(NORMAL_CYCLE_WEIGHTS), tuple(accumulate(NORMAL_CYCLE_WEIGHTS.values())))
+
+    # Headline and description shown when each cycle triggers
+    CYCLE_COPY: Dict[MarketCycleType, Tuple[str, str]] = {
+        MarketCycleType.BULL_MARKET: (
+            "🐂 BULL MARKET SURGE - Economic Expansion Accelerates!",
+            "Strong GDP growth, rising corporate profits, and investor optimism drive markets higher across all sectors."
+        ),
+        MarketCycleType.BEAR_MARKET: (
+            "🐻 BEAR MARKET BEGINS - Economic Slowdown Hits Markets",
+            "Weakening economic indicators, declining corporate earnings, and rising uncertainty push markets into sustained decline."
+        ),
+        MarketCycleType.RECESSION: (
+            "📉 RECESSION DECLARED - Economy Contracts for Second Consecutive Quarter",
+            "Official recession confirmed as unemployment rises, consumer spending falls, and businesses cut investment. Markets tumble."
+        ),
+        MarketCycleType.ENERGY_INFLATION: (
+            "🔥 ENERGY-DRIVEN INFLATION - Oil Prices Spike, Costs Surge",
+            "Soaring energy prices drive broader inflation. Energy sector profits while other industries struggle with rising costs and margin pressure."
+        ),
+        MarketCycleType.MARKET_CRASH: (
+            "💥 MARKET CRASH - Panic Selling Triggers Circuit Breakers",
+            "Severe market crash as cascading sell-offs spread panic. All sectors plummet in worst trading day in years."
+        ),
+        MarketCycleType.RECOVERY: (
+            "📈 ECONOMIC RECOVERY - Markets Rally on Strong Rebound Signals",
+            "Economy shows strong recovery signs. Stimulus measures take effect. Consumer confidence returns. Markets surge broadly."
+        ),
+        MarketCycleType.TECH_BOOM: (
+            "🚀 TECHNOLOGY BOOM - Innovation Wave Transforms Markets",
+            "Revolutionary tech breakthroughs spark investor frenzy. Technology and electronics sectors lead massive market rally."
+        ),
+        MarketCycleType.TECH_CORRECTION: (
+            "📉 TECH SECTOR CORRECTION - Valuation Concerns Trigger Selloff",
+            "Overvalued tech stocks face harsh reality check. Investors flee high P/E ratios. Technology sector plummets as bubble fears spread."
+        ),
+        MarketCycleType.ENERGY_CRISIS: (
+            "⚡ ENERGY CRISIS - Oil Prices Spike on Supply Disruption",
+            "Global energy shortage sends prices soaring. Energy sector rallies hard while other industries struggle with rising costs."
+        ),
+        MarketCycleType.FINANCIAL_SECTOR_BOOM: (
+            "💰 FINANCIAL SECTOR BOOM - Banking Profits Surge",
+            "Rising interest rates boost bank margins. Financial sector leads market rally. Other sectors see moderate gains."
+        ),
+        MarketCycleType.RETAIL_COLLAPSE: (
+            "🏪 RETAIL APOCALYPSE - Consumer Spending Crashes",
+            "Retail sector devastated as consumers tighten belts. Store closures accelerate. Retail stocks plummet."
+        ),
+        MarketCycleType.HEALTHCARE_RALLY: (
+            "🏥 HEALTHCARE RALLY - Medical Innovation Drives Sector Surge",
+            "Breakthrough treatments and aging demographics fuel healthcare boom. Healthcare stocks surge while other sectors lag."
+        ),
+        MarketCycleType.MANUFACTURING_SLUMP: (
+            "🏭 MANUFACTURING SLUMP - Industrial Production Declines",
+            "Weak demand and supply chain issues hammer manufacturing. Industrial and manufacturing stocks sink."
+        ),
+        MarketCycleType.BUBBLE_POP: (
+            "💥 BUBBLE BURSTS - Overvalued Markets Crash Back to Reality",
+            "Unsustainable valuations finally collapse. Panic selling across overheated sectors. Sharp correction as P/E ratios normalize."
+        ),
+        MarketCycleType.PROFIT_TAKING: (
+            "📊 PROFIT TAKING - Investors Lock in Gains After Rally",
+            "After strong run-up, investors cash out. Broad market pullback as profits are realized. Healthy correction underway."
+        ),
+        MarketCycleType.VOID_INVASION: (
+            "🌀 VOID INVASION - Reality Itself Unravels!",
+            "The Void consumes all but one stock each week! Markets descend into chaos as companies randomly phase in and out of existence."
+        ),
+        MarketCycleType.VOID_BLESSING: (
+            "✨ VOID BLESSING - The Void Smiles Upon the Chosen",
+            "Mysterious void energies amplify the stock being mimicked by Void Stocks! Reality warps in favor of the chosen company."
+        ),
+        MarketCycleType.SECTOR_ROTATION: (
+            "🔄 SECTOR ROTATION - Money Flows Between Industries",
+            "Investors rotate capital from overvalued to undervalued sectors. Winners become losers, losers become winners."
+        )
+    }
+
+    # Active-cycle banner for get_current_cycle_display, laid out once
+    CYCLE_BANNER = (
+        "\n" + "=" * 60 + "\n"
+        "🌍 ACTIVE GLOBAL MARKET CYCLE\n"
+        + "=" * 60 + "\n"
+        "{headline}\n\n"
+        "{description}\n\n"
+        "Duration: {weeks_remaining} weeks remaining"
+    )
+    CYCLE_BANNER_FOOTER = "\n" + "=" * 60 + "\n"
+
     def __init__(self):
         self.active_cycle: Optional[ActiveMarketCycle] = None
         self.cycle_history: List[Tuple[int, str]] = []  # (week_number, cycle_name)
@@ -3204,7 +3517,7 @@ class MarketCycle:
             market_cycle.active_cycle = ActiveMarketCycle.from_dict(data['active_cycle'])
         market_cycle.cycle_history = [tuple(item) for item in data['cycle_history']]
         if data.get('last_cycle_type'):
-            market_cycle.last_cycle_type = MarketCycleType(data['last_cycle_type'])
+            market_cycle.last_cycle_type = _CYCLE_TYPE_BY_VALUE[data['last_cycle_type']]
         market_cycle.void_invasion_safe_company = data.get('void_invasion_safe_company')
         market_cycle.void_blessing_blessed_company = data.get('void_blessing_blessed_company')
         return market_cycle
@@ -3219,7 +3532,9 @@ class MarketCycle:
         if not companies:
             return 20.0  # Default reasonable P/E
 
-        total_pe = sum(company.get_pe_ratio() for company in companies.values())
+        total_pe = 0.0
+        for company in companies.values():
+            total_pe += company.get_pe_ratio()
         return total_pe / len(companies)
 
     def trigger_cycle(self, week_number: int, companies: Dict[str, Company]) -> ActiveMarketCycle:
@@ -3233,105 +3548,28 @@ class MarketCycle:
         # Calculate average market P/E
         avg_pe = self.calculate_market_pe(companies)
 
-        # Define positive cycles that inflate prices
-        positive_cycles = {
-            MarketCycleType.TECH_BOOM,
-            MarketCycleType.BULL_MARKET,
-            MarketCycleType.RECOVERY,
-            MarketCycleType.FINANCIAL_SECTOR_BOOM,
-            MarketCycleType.HEALTHCARE_RALLY
-        }
-
-        # Define correction cycles that bring prices down
-        correction_cycles = {
-            MarketCycleType.BUBBLE_POP,
-            MarketCycleType.TECH_CORRECTION,
-            MarketCycleType.PROFIT_TAKING,
-            MarketCycleType.BEAR_MARKET,
-            MarketCycleType.MARKET_CRASH
-        }
-
         # Smart cycle selection based on market conditions
-        cycle_weights = {}
-
         # If last cycle was positive AND P/E is high, favor corrections
-        if self.last_cycle_type in positive_cycles and avg_pe > 30.0:
+        if self.last_cycle_type in self.POSITIVE_CYCLES and avg_pe > 30.0:
             # High P/E after boom = bubble territory, favor corrections
             if avg_pe > 50.0:
-                # Extreme overvaluation - very high chance of correction
-                cycle_weights = {
-                    MarketCycleType.BUBBLE_POP: 30,
-                    MarketCycleType.TECH_CORRECTION: 25,
-                    MarketCycleType.PROFIT_TAKING: 20,
-                    MarketCycleType.BEAR_MARKET: 15,
-                    MarketCycleType.SECTOR_ROTATION: 10
-                }
+                cycle_choices = self.EXTREME_PE_CYCLE_CHOICES
             elif avg_pe > 35.0:
-                # Moderate overvaluation - increased correction chance
-                cycle_weights = {
-                    MarketCycleType.PROFIT_TAKING: 25,
-                    MarketCycleType.TECH_CORRECTION: 20,
-                    MarketCycleType.BUBBLE_POP: 15,
-                    MarketCycleType.SECTOR_ROTATION: 15,
-                    MarketCycleType.BEAR_MARKET: 10,
-                    MarketCycleType.ENERGY_INFLATION: 10,
-                    MarketCycleType.BULL_MARKET: 5  # Small chance to continue
-                }
+                cycle_choices = self.MODERATE_PE_CYCLE_CHOICES
             else:
-                # Mild overvaluation (30-35 P/E) - small correction chance
-                cycle_weights = {
-                    MarketCycleType.SECTOR_ROTATION: 20,
-                    MarketCycleType.PROFIT_TAKING: 15,
-                    MarketCycleType.BULL_MARKET: 15,
-                    MarketCycleType.ENERGY_INFLATION: 15,
-                    MarketCycleType.TECH_CORRECTION: 10,
-                    MarketCycleType.ENERGY_CRISIS: 10,
-                    MarketCycleType.HEALTHCARE_RALLY: 10,
-                    MarketCycleType.BEAR_MARKET: 5
-                }
+                cycle_choices = self.MILD_PE_CYCLE_CHOICES
 
         # If last cycle was correction AND P/E is low, favor recovery
-        elif self.last_cycle_type in correction_cycles and avg_pe < 15.0:
-            # Undervalued market - favor recovery
-            cycle_weights = {
-                MarketCycleType.RECOVERY: 30,
-                MarketCycleType.BULL_MARKET: 20,
-                MarketCycleType.HEALTHCARE_RALLY: 15,
-                MarketCycleType.FINANCIAL_SECTOR_BOOM: 15,
-                MarketCycleType.TECH_BOOM: 10,
-                MarketCycleType.SECTOR_ROTATION: 10
-            }
+        elif self.last_cycle_type in self.CORRECTION_CYCLES and avg_pe < 15.0:
+            cycle_choices = self.RECOVERY_CYCLE_CHOICES
 
         # Normal conditions - balanced mix
         else:
-            cycle_weights = {
-                # Broad market events
-                MarketCycleType.BULL_MARKET: 12,
-                MarketCycleType.BEAR_MARKET: 10,
-                MarketCycleType.SECTOR_ROTATION: 12,
-                MarketCycleType.ENERGY_INFLATION: 10,
-                # Sector-specific events
-                MarketCycleType.TECH_BOOM: 8,
-                MarketCycleType.TECH_CORRECTION: 8,
-                MarketCycleType.ENERGY_CRISIS: 8,
-                MarketCycleType.FINANCIAL_SECTOR_BOOM: 7,
-                MarketCycleType.HEALTHCARE_RALLY: 7,
-                MarketCycleType.RETAIL_COLLAPSE: 6,
-                MarketCycleType.MANUFACTURING_SLUMP: 6,
-                # Major events (less common)
-                MarketCycleType.RECOVERY: 2,
-                MarketCycleType.RECESSION: 2,
-                MarketCycleType.MARKET_CRASH: 1,
-                MarketCycleType.BUBBLE_POP: 1,
-                # Void events (ultra rare - ~1% chance each)
-                MarketCycleType.VOID_INVASION: 1,
-                MarketCycleType.VOID_BLESSING: 1
-            }
+            cycle_choices = self.NORMAL_CYCLE_CHOICES
 
-        # Select cycle based on weights
-        cycles = list(cycle_weights.keys())
-        weights = list(cycle_weights.values())
-        cycle_type = random.choices(cycles, weights=weights, k=1)[0]
+        # Select cycle based on weights (same draw as random.choices, minus its per-call setup)
+        cycles, cum_weights = cycle_choices
+        cycle_type = cycles[bisect_right(cum_weights, random.random() * cum_weights[-1], 0, len(cycles) - 1)]
 
         # Set duration based on cycle type
         if cycle_type == MarketCycleType.VOID_INVASION:
@@ -3341,78 +3579,8 @@ class MarketCycle:
         else:
             duration = random.randint(8, 16)  # 2-4 months duration for normal cycles
 
-        # Generate headline and description based on cycle type
-        if cycle_type == MarketCycleType.BULL_MARKET:
-            headline = "🐂 BULL MARKET SURGE - Economic Expansion Accelerates!"
-            description = "Strong GDP growth, rising corporate profits, and investor optimism drive markets higher across all sectors."
-
-        elif cycle_type == MarketCycleType.BEAR_MARKET:
-            headline = "🐻 BEAR MARKET BEGINS - Economic Slowdown Hits Markets"
-            description = "Weakening economic indicators, declining corporate earnings, and rising uncertainty push markets into sustained decline."
-
-        elif cycle_type == MarketCycleType.RECESSION:
-            headline = "📉 RECESSION DECLARED - Economy Contracts for Second Consecutive Quarter"
-            description = "Official recession confirmed as unemployment rises, consumer spending falls, and businesses cut investment. Markets tumble."
-
-        elif cycle_type == MarketCycleType.ENERGY_INFLATION:
-            headline = "🔥 ENERGY-DRIVEN INFLATION - Oil Prices Spike, Costs Surge"
-            description = "Soaring energy prices drive broader inflation. Energy sector profits while other industries struggle with rising costs and margin pressure."
-
-        elif cycle_type == MarketCycleType.MARKET_CRASH:
-            headline = "💥 MARKET CRASH - Panic Selling Triggers Circuit Breakers"
-            description = "Severe market crash as cascading sell-offs spread panic. All sectors plummet in worst trading day in years."
-
-        elif cycle_type == MarketCycleType.RECOVERY:
-            headline = "📈 ECONOMIC RECOVERY - Markets Rally on Strong Rebound Signals"
-            description = "Economy shows strong recovery signs. Stimulus measures take effect. Consumer confidence returns. Markets surge broadly."
-
-        elif cycle_type == MarketCycleType.TECH_BOOM:
-            headline = "🚀 TECHNOLOGY BOOM - Innovation Wave Transforms Markets"
-            description = "Revolutionary tech breakthroughs spark investor frenzy. Technology and electronics sectors lead massive market rally."
-
-        elif cycle_type == MarketCycleType.TECH_CORRECTION:
-            headline = "📉 TECH SECTOR CORRECTION - Valuation Concerns Trigger Selloff"
-            description = "Overvalued tech stocks face harsh reality check. Investors flee high P/E ratios. Technology sector plummets as bubble fears spread."
-
-        elif cycle_type == MarketCycleType.ENERGY_CRISIS:
-            headline = "⚡ ENERGY CRISIS - Oil Prices Spike on Supply Disruption"
-            description = "Global energy shortage sends prices soaring. Energy sector rallies hard while other industries struggle with rising costs."
-
-        elif cycle_type == MarketCycleType.FINANCIAL_SECTOR_BOOM:
-            headline = "💰 FINANCIAL SECTOR BOOM - Banking Profits Surge"
-            description = "Rising interest rates boost bank margins. Financial sector leads market rally. Other sectors see moderate gains."
-
-        elif cycle_type == MarketCycleType.RETAIL_COLLAPSE:
-            headline = "🏪 RETAIL APOCALYPSE - Consumer Spending Crashes"
-            description = "Retail sector devastated as consumers tighten belts. Store closures accelerate. Retail stocks plummet."
-
-        elif cycle_type == MarketCycleType.HEALTHCARE_RALLY:
-            headline = "🏥 HEALTHCARE RALLY - Medical Innovation Drives Sector Surge"
-            description = "Breakthrough treatments and aging demographics fuel healthcare boom. Healthcare stocks surge while other sectors lag."
-
-        elif cycle_type == MarketCycleType.MANUFACTURING_SLUMP:
-            headline = "🏭 MANUFACTURING SLUMP - Industrial Production Declines"
-            description = "Weak demand and supply chain issues hammer manufacturing. Industrial and manufacturing stocks sink."
-
-        elif cycle_type == MarketCycleType.BUBBLE_POP:
-            headline = "💥 BUBBLE BURSTS - Overvalued Markets Crash Back to Reality"
-            description = "Unsustainable valuations finally collapse. Panic selling across overheated sectors. Sharp correction as P/E ratios normalize."
-
-        elif cycle_type == MarketCycleType.PROFIT_TAKING:
-            headline = "📊 PROFIT TAKING - Investors Lock in Gains After Rally"
-            description = "After strong run-up, investors cash out. Broad market pullback as profits are realized. Healthy correction underway."
-
-        elif cycle_type == MarketCycleType.VOID_INVASION:
-            headline = "🌀 VOID INVASION - Reality Itself Unravels!"
-            description = "The Void consumes all but one stock each week! Markets descend into chaos as companies randomly phase in and out of existence."
-
-        elif cycle_type == MarketCycleType.VOID_BLESSING:
-            headline = "✨ VOID BLESSING - The Void Smiles Upon the Chosen"
-            description = "Mysterious void energies amplify the stock being mimicked by Void Stocks! Reality warps in favor of the chosen company."
-
-        else:  # SECTOR_ROTATION
-            headline = "🔄 SECTOR ROTATION - Money Flows Between Industries"
-            description = "Investors rotate capital from overvalued to undervalued sectors. Winners become losers, losers become winners."
+        # Headline and description for the chosen cycle
+        headline, description = self.CYCLE_COPY[cycle_type]
 
         self.active_cycle = ActiveMarketCycle(
             cycle_type=cycle_type,
@@ -3448,29 +3616,25 @@ class MarketCycle:
 
     def get_current_cycle_display(self) -> Optional[str]:
         """Get display text for current active cycle"""
-        if not self.active_cycle:
+        active_cycle = self.active_cycle
+        if not active_cycle:
             return None
 
-        base_display = f"""
-{'='*60}
-🌍 ACTIVE GLOBAL MARKET CYCLE
-{'='*60}
-{self.active_cycle.headline}
-
-{self.active_cycle.description}
-
-Duration: {self.active_cycle.weeks_remaining} weeks remaining"""
+        base_display = self.CYCLE_BANNER.format(
+            headline=active_cycle.headline,
+            description=active_cycle.description,
+            weeks_remaining=active_cycle.weeks_remaining
+        )
 
         # Add void event specific info
-        if self.active_cycle.cycle_type == MarketCycleType.VOID_INVASION:
+        if active_cycle.cycle_type == MarketCycleType.VOID_INVASION:
             if self.void_invasion_safe_company:
                 base_display += f"\n🛡️  SAFE FROM VOID: {self.void_invasion_safe_company}"
-        elif self.active_cycle.cycle_type == MarketCycleType.VOID_BLESSING:
+        elif active_cycle.cycle_type == MarketCycleType.VOID_BLESSING:
             if self.void_blessing_blessed_company:
                 base_display += f"\n✨ BLESSED BY VOID: {self.void_blessing_blessed_company}"
 
-        base_display += f"\n{'='*60}\n"
-        return base_display
+        return base_display + self.CYCLE_BANNER_FOOTER
 
 
 class HedgeFund(Player):
@@ -3480,6 +3644,7 @@ class HedgeFund(Player):
         super().__init__(name, starting_cash)
         self.strategy = strategy  # "aggressive", "value", "contrarian"
         self.is_npc = True
+        self._picks_cache = None  # (companies dict, company count, high-vol picks, stable picks)
 
     def to_dict(self) -> dict:
         """Serialize hedge fund to dictionary"""
@@ -3578,20 +3743,46 @@ class HedgeFund(Player):
 
         return actions
 
+    def _strategy_picks(self, companies: Dict[str, Company]) -> Tuple[List[Company], List[Company]]:
+        """Get (two most volatile companies, stable value picks) for this roster
+
+        base_volatility and liquidity never change after a company is created, so the
+        picks are cached until the fund is handed a different or resized companies dict.
+        """
+        cache = self._picks_cache
+        if cache is None or cache[0] is not companies or cache[1] != len(companies):
+            high_vol_companies = heapq.nlargest(2, companies.values(), key=lambda c: c.base_volatility)
+
+            # Focus on low volatility, high liquidity stocks
+            stable_companies = [c for c in companies.values()
+                                if c.base_volatility < 7.0 and c.liquidity == LiquidityLevel.HIGH]
+
+            # Fallback to medium liquidity if no high liquidity stocks available
+            if not stable_companies:
+                stable_companies = [c for c in companies.values()
+                                    if c.base_volatility < 8.0 and c.liquidity in [LiquidityLevel.HIGH, LiquidityLevel.MEDIUM]]
+
+            cache = (companies, len(companies), high_vol_companies, stable_companies)
+            self._picks_cache = cache
+        return cache[2], cache[3]
+
     def _check_short_profits(self, companies: Dict[str, Company]) -> List[str]:
         """Check and take profits on short positions if profitable"""
         actions = []
 
-        for company_name in list(self.short_positions.keys()):
+        # No snapshot needed: the loop stops at the first successful cover, and a failed
+        # cover leaves short_positions untouched
+        for company_name, shares in self.short_positions.items():
             if company_name in companies:
                 company = companies[company_name]
-                shares = self.short_positions.get(company_name, 0)
 
                 if shares > 0:
                     # Check if we have price history to determine profit
-                    if len(company.price_history) >= 2:
+                    price_history = company.price_history
+                    if len(price_history) >= 2:
                         # Find the average price when we likely entered the short
-                        avg_entry_price = sum(company.price_history[-3:]) / min(3, len(company.price_history))
+                        recent_prices = price_history[-3:]  # Up to 3 weeks
+                        avg_entry_price = sum(recent_prices) / len(recent_prices)
                         current_price = company.price
 
                         # If stock fell 8%+ from average entry, take profits on 50% of position
@@ -3624,11 +3815,9 @@ class HedgeFund(Player):
                     actions.append(f"🏦 {self.name} borrowed ${borrow_amount:.2f} for aggressive plays")
 
         # Target high volatility stocks during bull markets or recovery
-        if market_cycle.active_cycle and market_cycle.active_cycle.cycle_type in [
-            MarketCycleType.BULL_MARKET, MarketCycleType.RECOVERY, MarketCycleType.TECH_BOOM
-        ]:
+        if market_cycle.active_cycle and market_cycle.active_cycle.cycle_type in _BULLISH_CYCLES:
             # Cover any existing short positions first (cut losses on shorts during bull market)
-            for company_name, shares in list(self.short_positions.items()):
+            for company_name, shares in self.short_positions.items():  # Stops at the first cover
                 if shares > 0:
                     company = companies[company_name]
                     # Cover as much as we can afford (at least 50% if possible)
@@ -3641,7 +3830,7 @@ class HedgeFund(Player):
                             break  # Cover one at a time
 
             # Buy high volatility stocks
-            high_vol_companies = sorted(companies.values(), key=lambda c: c.base_volatility, reverse=True)[:2]
+            high_vol_companies = self._strategy_picks(companies)[0]
             for company in high_vol_companies:
                 if self.cash > 2000:
                     dollar_amount = min(self.cash * 0.5, 15000)
@@ -3651,11 +3840,9 @@ class HedgeFund(Player):
                             actions.append(f"📈 {self.name} aggressively invested ${dollar_amount:.2f} in {company.name}")
 
         # Sell during bear markets or crashes AND SHORT SELL aggressively
-        elif market_cycle.active_cycle and market_cycle.active_cycle.cycle_type in [
-            MarketCycleType.BEAR_MARKET, MarketCycleType.MARKET_CRASH, MarketCycleType.RECESSION
-        ]:
+        elif market_cycle.active_cycle and market_cycle.active_cycle.cycle_type in _BEARISH_CYCLES:
             # Sell positions to cut losses
-            for company_name, shares in list(self.portfolio.items()):
+            for company_name, shares in list(self.portfolio.items()):  # Snapshot: sales can drop entries
                 sell_shares = shares * 0.4  # Sell 40% of position
                 if sell_shares > 0:
                     company = companies[company_name]
@@ -3666,7 +3853,7 @@ class HedgeFund(Player):
             # SHORT SELL high volatility stocks during downturns (aggressive bet against the market)
             equity = self.calculate_equity(companies, treasury)
             if equity > 3000:
-                high_vol_companies = sorted(companies.values(), key=lambda c: c.base_volatility, reverse=True)[:2]
+                high_vol_companies = self._strategy_picks(companies)[0]
                 for company in high_vol_companies:
                     # Don't short if we already have a large short position
                     current_short = self.short_positions.get(company.name, 0)
@@ -3681,7 +3868,7 @@ class HedgeFund(Player):
         # Baseline buying: always try to buy high volatility stocks if we have cash
         else:
             if self.cash > 2000:
-                high_vol_companies = sorted(companies.values(), key=lambda c: c.base_volatility, reverse=True)[:2]
+                high_vol_companies = self._strategy_picks(companies)[0]
                 for company in high_vol_companies:
                     if self.cash > 2000:
                         dollar_amount = min(self.cash * 0.4, 10000)
@@ -3710,14 +3897,8 @@ class HedgeFund(Player):
                 if success:
                     actions.append(f"🏦 {self.name} conservatively borrowed ${borrow_amount:.2f}")
 
-        # Focus on low volatility, high liquidity stocks
-        stable_companies = [c for c in companies.values()
-                          if c.base_volatility < 7.0 and c.liquidity == LiquidityLevel.HIGH]
-
-        # Fallback to medium liquidity if no high liquidity stocks available
-        if not stable_companies:
-            stable_companies = [c for c in companies.values()
-                              if c.base_volatility < 8.0 and c.liquidity in [LiquidityLevel.HIGH, LiquidityLevel.MEDIUM]]
+        # Focus on low volatility, high liquidity stocks (medium liquidity as a fallback)
+        stable_companies = self._strategy_picks(companies)[1]
 
         if stable_companies and self.cash > 2000:
             company = random.choice(stable_companies)
@@ -3728,9 +3909,7 @@ class HedgeFund(Player):
                     actions.append(f"💎 {self.name} invested ${dollar_amount:.2f} in {company.name} (value play)")
 
         # Buy treasury bonds for safety during volatile times
-        if market_cycle.active_cycle and market_cycle.active_cycle.cycle_type in [
-            MarketCycleType.MARKET_CRASH, MarketCycleType.RECESSION
-        ]:
+        if market_cycle.active_cycle and market_cycle.active_cycle.cycle_type in _FEAR_CYCLES:
             if self.cash > 500:
                 bonds_to_buy = int(self.cash * 0.3 / treasury.price)
                 if bonds_to_buy > 0:
@@ -3758,11 +3937,9 @@ class HedgeFund(Player):
                     actions.append(f"🏦 {self.name} borrowed ${borrow_amount:.2f} for contrarian positions")
 
         # BUY during crashes/recessions (buy fear) and COVER shorts
-        if market_cycle.active_cycle and market_cycle.active_cycle.cycle_type in [
-            MarketCycleType.MARKET_CRASH, MarketCycleType.RECESSION, MarketCycleType.BEAR_MARKET
-        ]:
+        if market_cycle.active_cycle and market_cycle.active_cycle.cycle_type in _BEARISH_CYCLES:
             # Cover short positions first when market is fearful (contrarian: others fear, we close shorts)
-            for company_name, shares in list(self.short_positions.items()):
+            for company_name, shares in self.short_positions.items():  # Stops at the first cover
                 if shares > 0:
                     cover_shares = int(shares * 0.6)  # Cover 60% of shorts
                     if cover_shares > 0:
@@ -3783,11 +3960,9 @@ class HedgeFund(Player):
                         actions.append(f"🎯 {self.name} bought the dip! Invested ${dollar_amount:.2f} in {company.name}")
 
         # SELL during bull markets/recovery (sell greed) and SHORT
-        elif market_cycle.active_cycle and market_cycle.active_cycle.cycle_type in [
-            MarketCycleType.BULL_MARKET, MarketCycleType.RECOVERY
-        ]:
+        elif market_cycle.active_cycle and market_cycle.active_cycle.cycle_type in _EUPHORIC_CYCLES:
             # Sell profitable positions
-            for company_name, shares in list(self.portfolio.items()):
+            for company_name, shares in list(self.portfolio.items()):  # Snapshot: sales can drop entries
                 if shares > 0.01:
                     sell_shares = shares * 0.5  # Sell 50% when market is euphoric
                     company = companies[company_name]
@@ -3859,6 +4034,8 @@ class InvestmentGame:
         self.slippage_bank = 0.0
 
         self._initialize_players()
+        # Human player names for Void Catalyst rotation (players never change mid-game)
+        self.human_player_names = frozenset(p.name for p in self.players if not getattr(p, 'is_npc', False))
         self._initialize_hedge_funds()
 
         # Pre-calculate initial future prices
@@ -4030,17 +4207,24 @@ class InvestmentGame:
 
         # Apply precompiled prices, EPS, and fundamentals to all companies
         # The future_*[company_name][0] is the actual next week value
+        future_prices = self.future_prices
+        future_eps = self.future_eps
+        future_fundamentals = self.future_fundamental_prices
         for company_name, company in self.companies.items():
-            if company_name in self.future_prices and len(self.future_prices[company_name]) > 0:
+            prices = future_prices.get(company_name)
+            if prices:
                 # Apply all precompiled values for this week
-                company.price = self.future_prices[company_name][0]
-                company.price_history.append(company.price)
+                price = prices[0]
+                company.price = price
+                company.price_history.append(price)
 
                 # Also update EPS and fundamental_price to keep in sync
-                if company_name in self.future_eps:
-                    company.earnings_per_share = self.future_eps[company_name][0]
-                if company_name in self.future_fundamental_prices:
-                    company.fundamental_price = self.future_fundamental_prices[company_name][0]
+                eps = future_eps.get(company_name)
+                if eps is not None:
+                    company.earnings_per_share = eps[0]
+                fundamentals = future_fundamentals.get(company_name)
+                if fundamentals is not None:
+                    company.fundamental_price = fundamentals[0]
 
         # Check if we should trigger a new market cycle
         cycle_triggered = False
@@ -4147,29 +4331,49 @@ class InvestmentGame:
         - Fundamental price random walk
         - Mean reversion (price pulled back toward fundamental)
         """
-        # Build a map of when impacts will occur for each company (for lingering effect calculation)
+        # Index pending impacts by company, and map when real ones occur (for lingering effect calculation)
         impact_weeks = {}  # company_name -> set of week numbers when impacts occur
+        impacts_by_company = {}  # company_name -> pending impacts for that company, in order
         for impact in self.breaking_news.pending_impacts:
+            impacts_by_company.setdefault(impact.company_name, []).append(impact)
             if impact.is_real:
                 impact_week = self.week_number + impact.weeks_until_impact
-                if impact.company_name not in impact_weeks:
-                    impact_weeks[impact.company_name] = set()
-                impact_weeks[impact.company_name].add(impact_week)
+                impact_weeks.setdefault(impact.company_name, set()).add(impact_week)
+
+        week_ahead = 4  # We're calculating the 4th week ahead
+        future_week = self.week_number + week_ahead
 
+        # The cycle in effect at week+4 is the same for every company, so settle it once:
+        # the active cycle if it will still be running, otherwise none
+        active_cycle = self.market_cycle.active_cycle
+        if active_cycle and active_cycle.weeks_remaining - (week_ahead - 1) > 0:
+            cycle_type = active_cycle.cycle_type
+        else:
+            cycle_type = None
+        # Industry-only cycles draw from a fixed band per industry (see _CYCLE_EFFECT_BANDS),
+        # so resolve the table once instead of dispatching per company
+        cycle_bands = _CYCLE_EFFECT_BANDS.get(cycle_type)
+
+        future_prices = self.future_prices
+        future_eps = self.future_eps
+        future_fundamentals = self.future_fundamental_prices
         for company_name, company in self.companies.items():
-            if company_name not in self.future_prices or len(self.future_prices[company_name]) == 0:
+            remaining_prices = future_prices.get(company_name)
+            if not remaining_prices:
                 # No existing future prices - recalculate all
                 self._precalculate_future_prices()
                 return
 
-            # Shift arrays: remove week+1 (which is now current), keep weeks +2, +3, +4
-            remaining_prices = self.future_prices[company_name][1:]
-            remaining_eps = self.future_eps[company_name][1:]
-            remaining_fundamentals = self.future_fundamental_prices[company_name][1:]
+            company_impacts = impacts_by_company.get(company_name, ())
+
+            # Shift arrays in place: remove week+1 (which is now current), keep weeks +2, +3, +4
+            remaining_eps = future_eps[company_name]
+            remaining_fundamentals = future_fundamentals[company_name]
+            del remaining_prices[0]
+            del remaining_eps[0]
+            del remaining_fundamentals[0]
 
             # Get the previous week's values to continue simulation
-            week_ahead = 4  # We're calculating the 4th week ahead
-            future_week = self.week_number + week_ahead
             simulated_price = remaining_prices[-1] if remaining_prices else company.price
             simulated_eps = remaining_eps[-1] if remaining_eps else company.earnings_per_share
             simulated_fundamental = remaining_fundamentals[-1] if remaining_fundamentals else company.fundamental_price
@@ -4189,29 +4393,24 @@ class InvestmentGame:
 
             # 3. Check if market impact will occur this week (check BEFORE applying random walk)
             news_impact_occurred = False
-            for impact in self.breaking_news.pending_impacts:
-                if impact.company_name == company_name:
-                    weeks_until = impact.weeks_until_impact - week_ahead
-                    if weeks_until == 0 and impact.is_real:
-                        news_impact_occurred = True
-                        break
+            for impact in company_impacts:
+                weeks_until = impact.weeks_until_impact - week_ahead
+                if weeks_until == 0 and impact.is_real:
+                    news_impact_occurred = True
+                    break
 
             # 4. Apply cycle effect or random walk to price
             # On market impact weeks, halve volatility instead of skipping it entirely
             volatility_multiplier = 0.5 if news_impact_occurred else 1.0
 
+            # With no cycle running, a new one may trigger at this future week - we don't
+            # know which type, so that stays neutral too
             cycle_effect = 0.0
-            if self.market_cycle.active_cycle:
-                # Check if cycle will still be active
-                weeks_left = self.market_cycle.active_cycle.weeks_remaining - (week_ahead - 1)
-                if weeks_left > 0:
-                    cycle_type = self.market_cycle.active_cycle.cycle_type
-                    cycle_effect = self._get_cycle_effect(cycle_type, company.industry, company_name)
-
-            # Check if a new cycle will trigger at this future week
-            elif future_week > 0 and future_week % 24 == 0:
-                # A new cycle would trigger - we don't know which type, so use neutral
-                cycle_effect = 0.0
+            if cycle_bands is not None:
+                sign, low, high = cycle_bands[0].get(company.industry, cycle_bands[1])
+                cycle_effect = sign * random.uniform(low, high)
+            elif cycle_type is not None:
+                cycle_effect = self._get_cycle_effect(cycle_type, company.industry, company_name)
 
             if cycle_effect != 0:
                 simulated_price *= (1 + (cycle_effect * volatility_multiplier) / 100)
@@ -4221,26 +4420,25 @@ class InvestmentGame:
                 simulated_price *= (1 + change_percent / 100)
 
             # 5. Apply pending news impacts that will occur in this future week
-            for impact in self.breaking_news.pending_impacts:
-                if impact.company_name == company_name:
-                    weeks_until = impact.weeks_until_impact - week_ahead
-                    if weeks_until == 0:
-                        # This impact will apply in this future week
-                        if impact.is_real:
-                            simulated_price *= (1 + impact.impact_magnitude / 100)
-
-                            # News also affects fundamental value (real business impact)
-                            if impact.impact_magnitude < 0:  # Negative news (scandals/problems)
-                                # Apply 15% of the price impact to fundamentals
-                                # e.g., -10% price drop → -1.5% fundamental drop
-                                fundamental_impact = impact.impact_magnitude * 0.15
-                                simulated_fundamental *= (1 + fundamental_impact / 100)
-                                simulated_fundamental = max(0.01, simulated_fundamental)
-                            else:  # Positive news (successes)
-                                # Apply 10% of the price impact to fundamentals (slightly less than scandals)
-                                # e.g., +10% price gain → +1.0% fundamental gain
-                                fundamental_impact = impact.impact_magnitude * 0.10
-                                simulated_fundamental *= (1 + fundamental_impact / 100)
+            for impact in company_impacts:
+                weeks_until = impact.weeks_until_impact - week_ahead
+                if weeks_until == 0:
+                    # This impact will apply in this future week
+                    if impact.is_real:
+                        simulated_price *= (1 + impact.impact_magnitude / 100)
+
+                        # News also affects fundamental value (real business impact)
+                        if impact.impact_magnitude < 0:  # Negative news (scandals/problems)
+                            # Apply 15% of the price impact to fundamentals
+                            # e.g., -10% price drop → -1.5% fundamental drop
+                            fundamental_impact = impact.impact_magnitude * 0.15
+                            simulated_fundamental *= (1 + fundamental_impact / 100)
+                            simulated_fundamental = max(0.01, simulated_fundamental)
+                        else:  # Positive news (successes)
+                            # Apply 10% of the price impact to fundamentals (slightly less than scandals)
+                            # e.g., +10% price gain → +1.0% fundamental gain
+                            fundamental_impact = impact.impact_magnitude * 0.10
+                            simulated_fundamental *= (1 + fundamental_impact / 100)
 
             # 6. Apply mean reversion - pull price back toward fundamental
             # SKIP mean reversion on weeks with ANY market impact (positive OR negative)
@@ -4271,9 +4469,9 @@ class InvestmentGame:
             simulated_price = max(0.01, simulated_price)
 
             # Update future arrays: old weeks +2, +3, +4 become new +1, +2, +3, and add new +4
-            self.future_prices[company_name] = remaining_prices + [simulated_price]
-            self.future_eps[company_name] = remaining_eps + [simulated_eps]
-            self.future_fundamental_prices[company_name] = remaining_fundamentals + [simulated_fundamental]
+            remaining_prices.append(simulated_price)
+            remaining_eps.append(simulated_eps)
+            remaining_fundamentals.append(simulated_fundamental)
 
     def _precalculate_future_prices(self):
         """
@@ -4292,22 +4490,38 @@ class InvestmentGame:
         self.future_eps = {}
         self.future_fundamental_prices = {}
 
-        # Build a map of when impacts will occur for each company (for lingering effect calculation)
+        # Index pending impacts by company, and map when real ones occur (for lingering effect calculation)
         impact_weeks = {}  # company_name -> set of week numbers when impacts occur
+        impacts_by_company = {}  # company_name -> pending impacts for that company, in order
         for impact in self.breaking_news.pending_impacts:
+            impacts_by_company.setdefault(impact.company_name, []).append(impact)
             if impact.is_real:
                 impact_week = self.week_number + impact.weeks_until_impact
-                if impact.company_name not in impact_weeks:
-                    impact_weeks[impact.company_name] = set()
-                impact_weeks[impact.company_name].add(impact_week)
+                impact_weeks.setdefault(impact.company_name, set()).add(impact_week)
 
-        # Calculate median P/E ratio for SECTOR_ROTATION cycle
+        # Calculate median P/E ratio for SECTOR_ROTATION cycle (the only cycle that reads it)
         # Exclude Rare Fantasy Goods as they don't participate in P/E-based rotation
-        pe_values = [c.get_pe_ratio() for c in self.companies.values() if c.industry != "Rare Fantasy Goods"]
-        median_pe = sorted(pe_values)[len(pe_values) // 2] if pe_values else 20.0
+        median_pe = 20.0
+        active_cycle = self.market_cycle.active_cycle
+        if active_cycle and active_cycle.cycle_type == MarketCycleType.SECTOR_ROTATION:
+            pe_values = [c.get_pe_ratio() for c in self.companies.values() if c.industry != "Rare Fantasy Goods"]
+            if pe_values:
+                median_pe = sorted(pe_values)[len(pe_values) // 2]
+
+        # Whether the active cycle is still running at week+1..+4 is the same for every
+        # company, so settle it once per simulated week
+        cycle_active_by_week = [
+            active_cycle is not None and active_cycle.weeks_remaining - (week_ahead - 1) > 0
+            for week_ahead in range(1, 5)
+        ]
+        # Industry-only cycles draw from a fixed band per industry (see _CYCLE_EFFECT_BANDS),
+        # so resolve each company's band once instead of dispatching every simulated week
+        cycle_bands = _CYCLE_EFFECT_BANDS.get(active_cycle.cycle_type) if active_cycle else None
 
         # For each company, calculate future prices, EPS, and fundamentals
         for company_name, company in self.companies.items():
+            cycle_band = cycle_bands[0].get(company.industry, cycle_bands[1]) if cycle_bands is not None else None
+            company_impacts = impacts_by_company.get(company_name, ())
             future_company_prices = []
             future_company_eps = []
             future_company_fundamentals = []
@@ -4344,33 +4558,29 @@ class InvestmentGame:
 
                 # 3. Check if market impact will occur this week (check BEFORE applying random walk)
                 news_impact_occurred = False
-                for impact in self.breaking_news.pending_impacts:
-                    if impact.company_name == company_name:
-                        weeks_until = impact.weeks_until_impact - week_ahead
-                        if weeks_until == 0 and impact.is_real:
-                            news_impact_occurred = True
-                            break
+                for impact in company_impacts:
+                    weeks_until = impact.weeks_until_impact - week_ahead
+                    if weeks_until == 0 and impact.is_real:
+                        news_impact_occurred = True
+                        break
 
                 # 4. Apply cycle effect or random walk to price
                 # On market impact weeks, halve volatility instead of skipping it entirely
                 volatility_multiplier = 0.5 if news_impact_occurred else 1.0
 
+                # With no cycle running, a new one may trigger at this future week - we don't
+                # know which type, so that stays neutral too
                 cycle_effect = 0.0
-                if self.market_cycle.active_cycle:
-                    # Check if cycle will still be active
-                    weeks_left = self.market_cycle.active_cycle.weeks_remaining - (week_ahead - 1)
-                    if weeks_left > 0:
-                        cycle_type = self.market_cycle.active_cycle.cycle_type
+                if cycle_active_by_week[week_ahead - 1]:
+                    if cycle_band is not None:
+                        sign, low, high = cycle_band
+                        cycle_effect = sign * random.uniform(low, high)
+                    else:
                         # Calculate P/E ratio for this simulated week (for BUBBLE_POP and SECTOR_ROTATION)
                         simulated_pe = (simulated_price / simulated_eps) if simulated_eps > 0.001 else 0.0
-                        cycle_effect = self._get_cycle_effect(cycle_type, company.industry, company_name,
+                        cycle_effect = self._get_cycle_effect(active_cycle.cycle_type, company.industry, company_name,
                                                               pe_ratio=simulated_pe, median_pe=median_pe)
 
-                # Check if a new cycle will trigger at this future week
-                elif future_week > 0 and future_week % 24 == 0:
-                    # A new cycle would trigger - we don't know which type, so use average effect
-                    cycle_effect = 0.0  # Neutral assumption for future cycle triggers
-
                 if cycle_effect != 0:
                     simulated_price *= (1 + (cycle_effect * volatility_multiplier) / 100)
                 else:
@@ -4379,26 +4589,25 @@ class InvestmentGame:
                     simulated_price *= (1 + change_percent / 100)
 
                 # 5. Apply pending news impacts that will occur in this future week
-                for impact in self.breaking_news.pending_impacts:
-                    if impact.company_name == company_name:
-                        weeks_until = impact.weeks_until_impact - week_ahead
-                        if weeks_until == 0:
-                            # This impact will apply in this future week
-                            if impact.is_real:
-                                simulated_price *= (1 + impact.impact_magnitude / 100)
-
-                                # News also affects fundamental value (real business impact)
-                                if impact.impact_magnitude < 0:  # Negative news (scandals/problems)
-                                    # Apply 15% of the price impact to fundamentals
-                                    # e.g., -10% price drop → -1.5% fundamental drop
-                                    fundamental_impact = impact.impact_magnitude * 0.15
-                                    simulated_fundamental *= (1 + fundamental_impact / 100)
-                                    simulated_fundamental = max(0.01, simulated_fundamental)
-                                else:  # Positive news (successes)
-                                    # Apply 10% of the price impact to fundamentals (slightly less than scandals)
-                                    # e.g., +10% price gain → +1.0% fundamental gain
-                                    fundamental_impact = impact.impact_magnitude * 0.10
-                                    simulated_fundamental *= (1 + fundamental_impact / 100)
+                for impact in company_impacts:
+                    weeks_until = impact.weeks_until_impact - week_ahead
+                    if weeks_until == 0:
+                        # This impact will apply in this future week
+                        if impact.is_real:
+                            simulated_price *= (1 + impact.impact_magnitude / 100)
+
+                            # News also affects fundamental value (real business impact)
+                            if impact.impact_magnitude < 0:  # Negative news (scandals/problems)
+                                # Apply 15% of the price impact to fundamentals
+                                # e.g., -10% price drop → -1.5% fundamental drop
+                                fundamental_impact = impact.impact_magnitude * 0.15
+                                simulated_fundamental *= (1 + fundamental_impact / 100)
+                                simulated_fundamental = max(0.01, simulated_fundamental)
+                            else:  # Positive news (successes)
+                                # Apply 10% of the price impact to fundamentals (slightly less than scandals)
+                                # e.g., +10% price gain → +1.0% fundamental gain
+                                fundamental_impact = impact.impact_magnitude * 0.10
+                                simulated_fundamental *= (1 + fundamental_impact / 100)
 
                 # 6. Apply mean reversion - pull price back toward fundamental
                 # SKIP mean reversion on weeks with ANY market impact (positive OR negative)
@@ -4466,158 +4675,15 @@ class InvestmentGame:
                 # Other companies - normal random walk
                 return 0.0
 
-        if cycle_type == MarketCycleType.BULL_MARKET:
-            if industry == "Rare Fantasy Goods":
-                # Rare goods don't follow bull markets - ultra-wealthy always buy
-                return random.uniform(1.0, 3.0)
-            elif industry == "Divine Services":
-                # People feel blessed, want to share prosperity with deities
-                return random.uniform(4.0, 8.0)
-            elif industry == "Magical Publishing":
-                # More disposable income for books and grimoires
-                return random.uniform(3.5, 6.0)
-            return random.uniform(3.0, 7.0)
-        elif cycle_type == MarketCycleType.BEAR_MARKET:
-            if industry == "Rare Fantasy Goods":
-                # Counter-cyclical: rich seek rare luxury goods as safe haven
-                return random.uniform(2.0, 6.0)
-            elif industry == "Divine Services":
-                # Counter-cyclical: people seek divine help during hard times
-                return random.uniform(3.0, 7.0)
-            elif industry == "Magical Publishing":
-                # Mixed: some buying for self-help, but less discretionary spending
-                return random.uniform(-1.0, 2.0)
-            return -random.uniform(2.0, 5.0)
-        elif cycle_type == MarketCycleType.RECESSION:
-            if industry == "Rare Fantasy Goods":
-                # Ultra-wealthy unaffected by recession, still buying rare items
-                return random.uniform(-1.0, 2.0)
-            elif industry == "Divine Services":
-                # Counter-cyclical: desperation drives people to seek miracles
-                return random.uniform(5.0, 10.0)
-            elif industry == "Magical Publishing":
-                # Books are somewhat discretionary, but educational aspect helps
-                return -random.uniform(1.0, 3.0)
-            return -random.uniform(4.0, 8.0)
-        elif cycle_type == MarketCycleType.ENERGY_INFLATION:
-            if industry == "Energy":
-                return random.uniform(4.0, 8.0)
-            elif industry == "Mana Extraction":
-                # Mana becomes more valuable during energy crises
-                return random.uniform(5.0, 10.0)
-            elif industry == "Rare Fantasy Goods":
-                # Rare goods are ultimate inflation hedge - hard assets
-                return random.uniform(8.0, 15.0)
-            elif industry == "Divine Services":
-                # People pray for relief from inflation, but can't afford services
-                return -random.uniform(1.0, 3.0)
-            elif industry == "Magical Publishing":
-                # Paper costs rise, but books are inflation hedge knowledge
-                return random.uniform(-0.5, 2.0)
-            else:
-                return -random.uniform(2.0, 4.0)
-        elif cycle_type == MarketCycleType.MARKET_CRASH:
-            if industry == "Golem Manufacturing":
-                # Golems crash HARD during market panic (fear of automation)
-                return -random.uniform(12.0, 20.0)
-            elif industry == "Mana Extraction":
-                # Mana extraction faces extreme volatility
-                return -random.uniform(10.0, 18.0)
-            elif industry == "Rare Fantasy Goods":
-                # Chaotic behavior during crashes - sometimes gains (flight to rarity)
-                return random.uniform(-5.0, 8.0)
-            elif industry == "Divine Services":
-                # Counter-cyclical: panic drives people to seek divine intervention
-                return random.uniform(8.0, 15.0)
-            elif industry == "Magical Publishing":
-                # People buy books on "How to Survive a Market Crash"
-                return random.uniform(1.0, 4.0)
-            else:
-                return -random.uniform(8.0, 15.0)
-        elif cycle_type == MarketCycleType.RECOVERY:
-            if industry == "Golem Manufacturing":
-                # Golems recover slower (trust issues)
-                return random.uniform(3.0, 6.0)
-            elif industry == "Rare Fantasy Goods":
-                # Doesn't need recovery - operates outside normal cycles
-                return random.uniform(0.0, 3.0)
-            elif industry == "Divine Services":
-                # Moderate recovery - people have less need for emergency prayers
-                return random.uniform(2.0, 5.0)
-            elif industry == "Magical Publishing":
-                # Normal recovery
-                return random.uniform(4.0, 8.0)
-            else:
-                return random.uniform(5.0, 10.0)
-        elif cycle_type == MarketCycleType.TECH_BOOM:
-            if industry in ["Technology", "Electronics"]:
-                return random.uniform(7.0, 12.0)
-            elif industry == "Golem Manufacturing":
-                # Golems BOOM during tech boom (automation hype)
-                return random.uniform(10.0, 15.0)
-            elif industry == "Mana Extraction":
-                # Mana benefits from tech boom (clean energy hype)
-                return random.uniform(6.0, 10.0)
-            elif industry == "Rare Fantasy Goods":
-                # Tech boom doesn't affect cosmic artifact market
-                return random.uniform(-1.0, 2.0)
-            elif industry == "Divine Services":
-                # People turn to tech instead of faith during tech boom
-                return -random.uniform(2.0, 5.0)
-            elif industry == "Magical Publishing":
-                # Digital grimoires and e-books boom with tech
-                return random.uniform(5.0, 9.0)
-            else:
-                return random.uniform(2.0, 4.0)
-
-        # NEW SECTOR-SPECIFIC EVENTS
-        elif cycle_type == MarketCycleType.TECH_CORRECTION:
-            # Tech crashes hard, others slightly down or flat
-            if industry in ["Technology", "Electronics"]:
-                return -random.uniform(8.0, 15.0)
-            else:
-                return random.uniform(-1.0, 2.0)  # Slight down to slight up
-
-        elif cycle_type == MarketCycleType.ENERGY_CRISIS:
-            # Energy surges, others struggle
-            if industry == "Energy":
-                return random.uniform(8.0, 14.0)
-            elif industry == "Golem Manufacturing":
-                # Heavy energy users hurt most
-                return -random.uniform(3.0, 6.0)
-            else:
-                return -random.uniform(1.0, 3.0)
-
-        elif cycle_type == MarketCycleType.FINANCIAL_SECTOR_BOOM:
-            # Financials surge, others moderate gains
-            if industry == "Finance":
-                return random.uniform(6.0, 11.0)
-            else:
-                return random.uniform(1.0, 3.0)
+        # Industry-banded cycles: one table lookup instead of walking the elif chain
+        bands = _CYCLE_EFFECT_BANDS.get(cycle_type)
+        if bands is not None:
+            industry_bands, default_band = bands
+            sign, low, high = industry_bands.get(industry, default_band)
+            return sign * random.uniform(low, high)
 
-        elif cycle_type == MarketCycleType.RETAIL_COLLAPSE:
-            # Retail crashes, others slightly down
-            if industry == "Retail":
-                return -random.uniform(10.0, 18.0)
-            else:
-                return -random.uniform(1.0, 3.0)
-
-        elif cycle_type == MarketCycleType.HEALTHCARE_RALLY:
-            # Pharmaceuticals surges, others modest gains
-            if industry == "Pharmaceuticals":
-                return random.uniform(6.0, 11.0)
-            else:
-                return random.uniform(0.5, 2.5)
-
-        elif cycle_type == MarketCycleType.MANUFACTURING_SLUMP:
-            # Golem Manufacturing down, others slightly down
-            if industry == "Golem Manufacturing":
-                return -random.uniform(7.0, 13.0)
-            else:
-                return -random.uniform(1.0, 3.0)
-
-        # CORRECTION EVENTS
-        elif cycle_type == MarketCycleType.BUBBLE_POP:
+        # P/E-dependent correction events
+        if cycle_type == MarketCycleType.BUBBLE_POP:
             # Sharp correction across board, especially high P/E stocks
             if industry == "Rare Fantasy Goods":
                 # Rare goods ignore P/E ratios - erratic behavior
@@ -4631,10 +4697,6 @@ class InvestmentGame:
                 else:
                     return -random.uniform(4.0, 8.0)
 
-        elif cycle_type == MarketCycleType.PROFIT_TAKING:
-            # Moderate broad correction
-            return -random.uniform(3.0, 7.0)
-
         elif cycle_type == MarketCycleType.SECTOR_ROTATION:
             # High P/E sectors down, low P/E sectors up
             if industry == "Rare Fantasy Goods":
@@ -5190,9 +5252,8 @@ class InvestmentGame:
                 # Void Catalyst
                 confirm = input(f"Buy Void Catalyst for ${self.void_catalyst.price:.2f}? (y/n): ")
                 if confirm.lower() == 'y':
-                    # Get list of all human player names (excluding NPCs)
-                    human_players = [p.name for p in self.players if not getattr(p, 'is_npc', False)]
-                    success, msg = player.buy_void_catalyst(self.void_catalyst, human_players)
+                    # All human player names (excluding NPCs), built once per game
+                    success, msg = player.buy_void_catalyst(self.void_catalyst, self.human_player_names)
                     print(msg)
             else:
                 print("Invalid choice!")
@@ -5526,6 +5587,7 @@ class InvestmentGame:
 
             # Restore players
             game.players = [Player.from_dict(data) for data in game_state['players']]
+            game.human_player_names = frozenset(p.name for p in game.players if not getattr(p, 'is_npc', False))
 
             # Restore hedge funds
             game.hedge_funds = [HedgeFund.from_dict(data) for data in game_state['hedge_funds']]
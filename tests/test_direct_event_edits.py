@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Test that breaking news copes with company_events being edited directly"""
+
+import random
+from investment_sim import (
+    BreakingNewsSystem, Company, CompanyEvent, EventType, LiquidityLevel
+)
+
+
+def test_replaced_event_list():
+    """Replacing a company's event list (same length) must not resurface the old events"""
+    random.seed(7)
+
+    companies = {
+        "TechCorp": Company("TechCorp", "Technology", 150.0, 8.0, LiquidityLevel.HIGH, 50_000_000_000),
+        "ElectroMax": Company("ElectroMax", "Electronics", 85.0, 6.5, LiquidityLevel.MEDIUM, 10_000_000_000),
+    }
+    breaking_news = BreakingNewsSystem()
+
+    # Run a few weeks so some events are pending
+    week = 0
+    for week in range(1, 6):
+        breaking_news.generate_breaking_news(companies, week)
+
+    # Swap each company's pending events for a same-length list of fresh, already-public events
+    replacement_count = 0
+    for company_name in companies:
+        old_events = breaking_news.company_events.get(company_name, [])
+        new_events = [
+            CompanyEvent(
+                event_type=EventType.SUCCESS,
+                severity=0.5,
+                description=f"{company_name} replacement event {i}",
+                discovery_week=week,
+                weeks_until_public=0,
+                industry=companies[company_name].industry
+            )
+            for i in range(max(1, len(old_events)))
+        ]
+        breaking_news.company_events[company_name] = new_events
+        replacement_count += len(new_events)
+
+    # Should not raise, and every replacement event should go public this week
+    breaking_news.generate_breaking_news(companies, week + 1)
+
+    reported = [text for news_week, text in breaking_news.news_history
+                if news_week == week + 1 and "replacement" in text]
+    print(f"✅ Reported after direct edit: {reported}")
+    assert len(reported) == replacement_count, \
+        f"❌ Expected {replacement_count} replacement events to go public, got {len(reported)}"
+    for company_name in companies:
+        assert all("replacement" not in event.description
+                   for event in breaking_news.company_events[company_name]), \
+            f"❌ Public replacement events for {company_name} were not consumed"
+
+    print("✅ SUCCESS: Direct company_events edits are picked up by generate_breaking_news")
+
+
+if __name__ == "__main__":
+    test_replaced_event_list()
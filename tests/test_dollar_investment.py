@@ -112,6 +112,24 @@ def test_sell_by_dollar_amount():
 
     print("✓ Sell by dollar amount test passed!\n")
 
+def test_slippage_solver_exact():
+    """Test that dollar-based trades land exactly on the requested amount after slippage"""
+    print("Testing slippage solver...")
+
+    # Low liquidity, small cap: slippage is large enough to matter
+    company = Company("ThinCorp", "Technology", 100.0, 13.0, LiquidityLevel.LOW, 1_000_000_000)
+
+    for dollar_amount in [250.0, 50_000.0, 500_000.0, 5_000_000.0]:
+        for is_buy in [True, False]:
+            shares, slippage_factor = company.shares_for_amount(dollar_amount, is_buy=is_buy)
+            trade_value = shares * company.price * slippage_factor
+            print(f"  ${dollar_amount:,.0f} {'buy' if is_buy else 'sell'}: {shares:.4f} shares (factor {slippage_factor:.4f})")
+            assert abs(trade_value - dollar_amount) < 1e-6, f"Trade value ${trade_value:.6f} != ${dollar_amount:.2f}"
+            # Factor must match what calculate_slippage charges for that size
+            assert slippage_factor == company.calculate_slippage(shares, is_buy=is_buy)
+
+    print("✓ Slippage solver test passed!\n")
+
 if __name__ == "__main__":
     print("="*60)
     print("Running Dollar Investment System Tests")
@@ -121,6 +139,7 @@ if __name__ == "__main__":
     test_leverage()
     test_sell_fractional()
     test_sell_by_dollar_amount()
+    test_slippage_solver_exact()
 
     print("="*60)
     print("All tests passed! ✓")
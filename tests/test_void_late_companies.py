@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Test that Void Stocks keeps its company list in step with the companies dict"""
+
+import random
+from investment_sim import Company, VoidStocks
+
+
+def test_void_stocks_late_companies():
+    """VoidStocks built over an empty dict should copy companies after refresh_company_names"""
+    random.seed(3)
+
+    companies = {}
+    void_stocks = VoidStocks(companies)
+
+    # Populate the shared dict after construction, then re-read it
+    companies["TechCorp"] = Company("TechCorp", "Technology", 150.0, 8.0)
+    companies["PharmaCare"] = Company("PharmaCare", "Pharmaceuticals", 220.0, 5.0)
+    void_stocks.refresh_company_names()
+
+    copied = []
+    for _ in range(20):
+        void_stocks.update_price()
+        if not void_stocks.is_void_week:
+            copied.append((void_stocks.get_current_company_name(), void_stocks.price))
+
+    print(f"✅ Copied weeks: {copied}")
+    assert copied, "❌ Expected at least one non-void week in 20 rolls"
+    for name, price in copied:
+        assert name in companies, f"❌ Copied unknown company {name}"
+        assert price == companies[name].price, f"❌ Price {price} does not match {name}"
+
+    print("✅ SUCCESS: Void Stocks copies companies added after construction")
+
+
+def test_void_stocks_load_missing_company():
+    """Loading a save that names a missing company should keep names and companies aligned"""
+    companies = {
+        "TechCorp": Company("TechCorp", "Technology", 150.0, 8.0),
+        "PharmaCare": Company("PharmaCare", "Pharmaceuticals", 220.0, 5.0),
+    }
+    data = {
+        'price': 0.0,
+        'weeks_elapsed': 4,
+        'current_company_name': "TechCorp",
+        'company_names': ["GoneCorp", "PharmaCare", "TechCorp"],
+        'is_void_week': True
+    }
+
+    void_stocks = VoidStocks.from_dict(data, companies)
+
+    print(f"✅ Loaded names: {void_stocks.company_names}")
+    assert void_stocks.company_names == ["PharmaCare", "TechCorp"], \
+        f"❌ Missing company was not dropped: {void_stocks.company_names}"
+    for name, company in zip(void_stocks.company_names, void_stocks._company_list):
+        assert company is companies[name], f"❌ {name} is paired with {company.name}"
+
+    print("✅ SUCCESS: Void Stocks names and companies stay aligned after load")
+
+
+if __name__ == "__main__":
+    test_void_stocks_late_companies()
+    test_void_stocks_load_missing_company()